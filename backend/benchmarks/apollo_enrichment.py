@@ -0,0 +1,70 @@
+"""
+Benchmark: Apollo organization enrichment of one company search, one domain at a time vs concurrent.
+
+A local stand-in answers organizations/enrich with a random latency (and fails one domain
+on purpose) so the run shows both the wall-clock difference and that a failing domain no
+longer discards the organizations already enriched.
+
+Usage (from backend/):
+    uv run python -m benchmarks.apollo_enrichment --domains 20 --runs 5
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from fastapi import FastAPI, HTTPException
+
+from benchmarks.utils import run_stand_in
+from src.candidates.services.apollo import ApolloService
+
+STAND_IN_HOST = "127.0.0.1"
+STAND_IN_PORT = 54331
+FAILING_DOMAIN = "broken.example.com"
+
+def run_apollo_stand_in(min_latency: float, max_latency: float):
+    stand_in = FastAPI()
+
+    @stand_in.post("/api/v1/organizations/enrich")
+    async def enrich(domain: str):
+        await asyncio.sleep(random.uniform(min_latency, max_latency))
+        if domain == FAILING_DOMAIN:
+            raise HTTPException(status_code=500)
+        return {"organization": {"id": f"org_{domain}", "name": domain, "primary_domain": domain}}
+
+    return run_stand_in(stand_in, STAND_IN_HOST, STAND_IN_PORT)
+
+def measure(max_workers: int, domains: list[str], n_runs: int) -> tuple[list[float], int]:
+    apollo_service = ApolloService(f"bench-{max_workers}", max_workers=max_workers, requests_per_minute=6000, burst=len(domains))
+    apollo_service.base_url = f"http://{STAND_IN_HOST}:{STAND_IN_PORT}/api/v1"
+
+    timings = []
+    for _ in range(n_runs):
+        start = time.perf_counter()
+        organizations = apollo_service.enrich_organizations(domains)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings, len(organizations)
+
+def main(n_domains: int, n_runs: int, max_workers: int):
+    domains = [f"company{i}.example.com" for i in range(n_domains - 1)] + [FAILING_DOMAIN]
+
+    print(f"enrich_organizations({n_domains} domains, 1 failing) x {n_runs}")
+    for name, workers in (("one at a time", 1), (f"{max_workers} workers", max_workers)):
+        timings, enriched = measure(workers, domains, n_runs)
+        print(f"  {name:<14} mean={statistics.mean(timings):8.2f} ms  max={max(timings):8.2f} ms  enriched={enriched}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--domains", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument("--min-latency", type=float, default=0.2)
+    parser.add_argument("--max-latency", type=float, default=0.6)
+    args = parser.parse_args()
+
+    server = run_apollo_stand_in(args.min_latency, args.max_latency)
+    try:
+        main(args.domains, args.runs, args.workers)
+    finally:
+        server.should_exit = True
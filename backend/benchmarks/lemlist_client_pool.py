@@ -0,0 +1,102 @@
+"""
+Micro-benchmark: Lemlist calls of one campaigns dashboard load with a client per call vs the pooled LemListService client.
+
+GET /campaigns makes one get_campaigns call plus get_campaign_stats, get_campaign_leads and
+get_lead_activities per campaign. This replays that sequence against a local Lemlist stand-in.
+The stand-in is plain HTTP, so the per-call TLS handshake saved in production comes on top
+of the numbers reported here.
+
+Usage (from backend/):
+    uv run python -m benchmarks.lemlist_client_pool --loads 50 --campaigns 5
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi import FastAPI
+
+from benchmarks.utils import run_stand_in, percentile
+from src.campaigns.services.lemlist_async import LemListService
+
+STAND_IN_HOST = "127.0.0.1"
+STAND_IN_PORT = 54330
+
+def run_lemlist_stand_in(n_campaigns: int):
+    stand_in = FastAPI()
+
+    @stand_in.get("/api/campaigns")
+    async def campaigns():
+        return {"campaigns": [{"_id": f"cam_{i}", "status": "running"} for i in range(n_campaigns)]}
+
+    @stand_in.get("/api/v2/campaigns/{campaign_id}/stats")
+    async def campaign_stats(campaign_id: str):
+        return {"nbLeads": 20, "nbLeadsOpened": 8}
+
+    @stand_in.get("/api/campaigns/{campaign_id}/export/leads")
+    async def campaign_leads(campaign_id: str):
+        return [{"_id": f"lea_{i}", "email": f"lead{i}@example.com"} for i in range(20)]
+
+    @stand_in.get("/api/activities")
+    async def activities():
+        return [{"leadId": f"lea_{i}", "type": "emailsOpened", "isFirst": True} for i in range(20)]
+
+    return run_stand_in(stand_in, STAND_IN_HOST, STAND_IN_PORT)
+
+async def dashboard_load(lemlist_service: LemListService, per_call_client: bool):
+    async def call(coroutine):
+        result = await coroutine
+        if per_call_client:
+            # Previous behaviour: every call opened (and tore down) its own connection
+            await lemlist_service.aclose()
+        return result
+
+    campaigns = await call(lemlist_service.get_campaigns())
+    for campaign in campaigns.get("campaigns"):
+        await call(lemlist_service.get_campaign_stats(campaign.get("_id"), "2025-01-01", "2025-12-12"))
+        await call(lemlist_service.get_campaign_leads(campaign.get("_id")))
+        await call(lemlist_service.get_lead_activities(campaign.get("_id")))
+
+async def measure(per_call_client: bool, n_loads: int) -> list[float]:
+    lemlist_service = LemListService("bench")
+    lemlist_service.base_url = f"http://{STAND_IN_HOST}:{STAND_IN_PORT}/api"
+    await lemlist_service.open()
+
+    timings = []
+    try:
+        await dashboard_load(lemlist_service, per_call_client)
+        for _ in range(n_loads):
+            start = time.perf_counter()
+            await dashboard_load(lemlist_service, per_call_client)
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        await lemlist_service.aclose()
+    return timings
+
+async def main(n_loads: int, n_campaigns: int):
+    results = {
+        "client per call": await measure(True, n_loads),
+        "pooled client": await measure(False, n_loads),
+    }
+
+    print(f"Dashboard load ({1 + 3 * n_campaigns} Lemlist calls) x {n_loads}")
+    for name, timings in results.items():
+        print(
+            f"  {name:<16} p50={statistics.median(timings):7.2f} ms"
+            f"  p99={percentile(timings, 99):7.2f} ms"
+            f"  mean={statistics.mean(timings):7.2f} ms"
+        )
+    saved = statistics.mean(results["client per call"]) - statistics.mean(results["pooled client"])
+    print(f"  saved per dashboard load: {saved:.2f} ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--loads", type=int, default=50)
+    parser.add_argument("--campaigns", type=int, default=5)
+    args = parser.parse_args()
+
+    server = run_lemlist_stand_in(args.campaigns)
+    try:
+        asyncio.run(main(args.loads, args.campaigns))
+    finally:
+        server.should_exit = True
@@ -0,0 +1,95 @@
+"""
+Benchmark: GET /candidates/{id} with a per-request Supabase client vs the app-lifetime pooled client.
+
+Runs a local PostgREST stand-in, points the app at it and drives the real FastAPI app
+in-process. TLS is not involved locally, so production savings are larger than what
+is reported here (every per-request client also paid for a TLS handshake).
+
+Usage (from backend/):
+    uv run python -m benchmarks.supabase_client_pool --requests 500
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+STAND_IN_HOST = "127.0.0.1"
+STAND_IN_PORT = 54329
+
+os.environ.setdefault("SUPABASE_URL", f"http://{STAND_IN_HOST}:{STAND_IN_PORT}")
+os.environ.setdefault("SUPABASE_SECRET_KEY", "bench.bench.bench")
+os.environ.setdefault("SUPABASE_JWT_SECRET", "bench")
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+
+import httpx
+from fastapi import FastAPI, Request
+
+from benchmarks.utils import run_stand_in, percentile
+
+CANDIDATE_ROW = {
+    "id": 1,
+    "first_name": "Bench",
+    "last_name": "Candidate",
+    "processing_status": "candidate_data_extracted",
+    "extracted_data": {"core_competencies": ["x" * 64] * 32},
+}
+
+def run_postgrest_stand_in():
+    stand_in = FastAPI()
+
+    @stand_in.get("/rest/v1/{table}")
+    async def select(table: str, request: Request):
+        if "vnd.pgrst.object" in request.headers.get("accept", ""):
+            return CANDIDATE_ROW
+        return [CANDIDATE_ROW]
+
+    return run_stand_in(stand_in, STAND_IN_HOST, STAND_IN_PORT)
+
+async def measure(app, n_requests: int) -> list[float]:
+    transport = httpx.ASGITransport(app=app)
+    timings = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm-up
+        await client.get("/candidates/1")
+        for _ in range(n_requests):
+            start = time.perf_counter()
+            response = await client.get("/candidates/1")
+            timings.append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+    return timings
+
+async def main(n_requests: int):
+    from src.main import app
+    from src.core.database import get_supabase_admin_client, create_supabase
+
+    async def per_request_client():
+        # Previous behaviour: a brand-new client (and connection) for every request
+        return await create_supabase()
+
+    results = {}
+    async with app.router.lifespan_context(app):
+        app.dependency_overrides[get_supabase_admin_client] = per_request_client
+        results["per-request client"] = await measure(app, n_requests)
+
+        app.dependency_overrides.clear()
+        results["pooled client"] = await measure(app, n_requests)
+
+    print(f"GET /candidates/{{id}} x {n_requests}")
+    for name, timings in results.items():
+        print(
+            f"  {name:<20} p50={statistics.median(timings):7.2f} ms"
+            f"  p99={percentile(timings, 99):7.2f} ms"
+            f"  mean={statistics.mean(timings):7.2f} ms"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    server = run_postgrest_stand_in()
+    try:
+        asyncio.run(main(args.requests))
+    finally:
+        server.should_exit = True
@@ -0,0 +1,19 @@
+import threading
+import time
+
+import uvicorn
+
+def run_stand_in(app, host: str, port: int) -> uvicorn.Server:
+    """Serve a local stand-in for a third-party API on a background thread."""
+    config = uvicorn.Config(app, host=host, port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
@@ -1,18 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from src.core.database import get_supabase_admin_client, AsyncClient
-from src.config import LEMLIST_API_KEY
-from src.campaigns.services.lemlist_async import LemListService
 import traceback
+import asyncio
 from src.campaigns.tasks import create_campaign as create_campaign_task
 from src.campaigns.schemas import CampaignStats
 from src.campaigns.services.lemlist_async import Campaign
 from src.candidates.schemas import ProcessingStatusEnum
+from src.candidates.repository import CandidateRepository, CandidateProjection
+from src.dependencies import get_candidate_repository
+from src.services.candidate_lifecycle_service import lemlist_service
+from src.core.idempotency import task_deduplicator
 
 router = APIRouter(tags=["Campaigns"])
 
-lemlist_service = LemListService(LEMLIST_API_KEY)
-
 # Frontend endpoints
 
 @router.get("/campaigns/stats")
@@ -165,20 +166,25 @@ class CampaignCreate(BaseModel):
 async def create_campaign(
     # current_user: AdminOnly,
     campaign_create: CampaignCreate,
-    supabase_admin_client: AsyncClient = Depends(get_supabase_admin_client)
+    supabase_admin_client: AsyncClient = Depends(get_supabase_admin_client),
+    candidate_repository: CandidateRepository = Depends(get_candidate_repository)
 ):
-    
+    # A double submit must not create a second Lemlist campaign and enqueue create_campaign twice
+    idempotency_key = task_deduplicator.key(campaign_create.candidate_id, "create_campaign", campaign_create.name)
+    if not await asyncio.to_thread(task_deduplicator.claim, idempotency_key):
+        raise HTTPException(status_code=409, detail="Campaign creation already in progress")
+
     try:
 
-        candidate = await supabase_admin_client.table("candidates").select("*").eq("id", campaign_create.candidate_id).execute()
+        candidate = await candidate_repository.get(campaign_create.candidate_id, CandidateProjection.STATUS)
 
-        if len(candidate.data) == 0:
+        if candidate is None:
             raise HTTPException(status_code=404, detail="Candidate not found")
 
-        if candidate.data[0].get("processing_status") == ProcessingStatusEnum.CAMPAIGN_CREATED or candidate.data[0].get("processing_status") == ProcessingStatusEnum.CAMPAIGN_CREATING:
+        if candidate.get("processing_status") == ProcessingStatusEnum.CAMPAIGN_CREATED or candidate.get("processing_status") == ProcessingStatusEnum.CAMPAIGN_CREATING:
             raise HTTPException(status_code=400, detail="Campaign already created or creating")
 
-        if candidate.data[0].get("processing_status") != ProcessingStatusEnum.DECISION_MAKERS_FOUND:
+        if candidate.get("processing_status") != ProcessingStatusEnum.DECISION_MAKERS_FOUND:
             raise HTTPException(status_code=400, detail="Candidate is not ready for campaign")
 
         await supabase_admin_client.table("candidates").update({
@@ -192,10 +198,15 @@ async def create_campaign(
             "lemlist_campaign_id": lemlist_campaign.get("_id"),
         }).execute()
 
-        create_campaign_task.apply_async(args=[campaign_create.candidate_id, lemlist_campaign.get("sequenceId")])
+        create_campaign_task.apply_async(
+            args=[campaign_create.candidate_id, lemlist_campaign.get("sequenceId")],
+            kwargs={"idempotency_key": idempotency_key}
+        )
 
         return campaign_response.data[0]
     except Exception as e:
+        # Nothing was enqueued; release the key so the request can be retried
+        await asyncio.to_thread(task_deduplicator.finish, idempotency_key, False)
         print(traceback.format_exc())
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1,6 +1,8 @@
 import httpx
 from pydantic import BaseModel
 
+from src.core.http import PooledAsyncClient
+
 class Creator(BaseModel):
     userId: str
     userEmail: str
@@ -19,7 +21,13 @@ class Campaign(BaseModel):
     senders: list[Sender]
 
 class LemListService:
-    def __init__(self, api_key: str):
+    def __init__(self,
+                 api_key: str,
+                 max_connections: int = 20,
+                 max_keepalive_connections: int = 10,
+                 keepalive_expiry: float = 30,
+                 timeout: float = 30,
+                 http2: bool = True):
         self.api_key = api_key
         self.headers = {
             "Content": "application/json",
@@ -27,14 +35,24 @@ class LemListService:
             "Authorization": f"Basic {self.api_key}",
         }
         self.base_url = "https://api.lemlist.com/api"
+        self.http = PooledAsyncClient(max_connections, max_keepalive_connections, keepalive_expiry, timeout, http2)
+
+    async def open(self):
+        await self.http.open()
+
+    async def aclose(self):
+        await self.http.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self.http.client
 
     async def get_campaign(self, campaign_id: str):
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/campaigns/{campaign_id}",
-                headers=self.headers
-            )
+        response = await self.client.get(
+            f"{self.base_url}/campaigns/{campaign_id}",
+            headers=self.headers
+        )
 
         campaign = Campaign.model_validate(response.json())
         
@@ -46,32 +64,29 @@ class LemListService:
             "version": "v2"
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/campaigns",
-                headers=self.headers,
-                params=params
-            )
+        response = await self.client.get(
+            f"{self.base_url}/campaigns",
+            headers=self.headers,
+            params=params
+        )
         
         return response.json()
     
     async def get_campaign_sequences(self, campaign_id: str):
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/campaigns/{campaign_id}/sequences",
-                headers=self.headers
-            )
+        response = await self.client.get(
+            f"{self.base_url}/campaigns/{campaign_id}/sequences",
+            headers=self.headers
+        )
         
         return response.json()
 
 
     async def create_campaign(self, name: str):
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/campaigns",
-                headers=self.headers,
-                json={"name": name}
-            )
+        response = await self.client.post(
+            f"{self.base_url}/campaigns",
+            headers=self.headers,
+            json={"name": name}
+        )
 
         if response.status_code != 200:
             raise Exception(response.content)
@@ -80,62 +95,58 @@ class LemListService:
     
     async def create_sequence_step(self, sequence_id: str, subject: str, message: str):
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/sequences/{sequence_id}/steps",
-                headers=self.headers,
-                json={
-                    "type": "email",
-                    "subject": subject,
-                    "message": message,
-                    "delay": 2
-                }
-            )
+        response = await self.client.post(
+            f"{self.base_url}/sequences/{sequence_id}/steps",
+            headers=self.headers,
+            json={
+                "type": "email",
+                "subject": subject,
+                "message": message,
+                "delay": 2
+            }
+        )
 
         return response.json()
     
     async def update_sequence_step(self, sequence_id: str, step_id: str, subject: str, message: str, delay: int):
 
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{self.base_url}/sequences/{sequence_id}/steps/{step_id}",
-                headers=self.headers,
-                json={
-                    "type": "email",
-                    "subject": subject,
-                    "message": message,
-                    "delay": delay
-                }
-            )
+        response = await self.client.patch(
+            f"{self.base_url}/sequences/{sequence_id}/steps/{step_id}",
+            headers=self.headers,
+            json={
+                "type": "email",
+                "subject": subject,
+                "message": message,
+                "delay": delay
+            }
+        )
 
         return response.json()
     
     async def delete_sequence_step(self, sequence_id: str, step_id: str):
 
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{self.base_url}/sequences/{sequence_id}/steps/{step_id}",
-                headers=self.headers,
-            )
+        response = await self.client.delete(
+            f"{self.base_url}/sequences/{sequence_id}/steps/{step_id}",
+            headers=self.headers,
+        )
 
         return response.json()
     
     async def create_lead_in_campaign(self, campaign_id: str, email: str, first_name: str, last_name: str, company_name: str, job_title: str, linkedin_url: str, company_domain: str, variables: dict):
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/campaigns/{campaign_id}/leads/{email}?deduplicate=true",
-                headers=self.headers,
-                json={
-                    "firstName": first_name,
-                    "lastName": last_name,
-                    "companyName": company_name,
-                    "jobTitle": job_title,
-                    "linkedinUrl": linkedin_url,
-                    "companyDomain": company_domain,
-                    **variables
-                }
-            )
+        response = await self.client.post(
+            f"{self.base_url}/campaigns/{campaign_id}/leads/{email}?deduplicate=true",
+            headers=self.headers,
+            json={
+                "firstName": first_name,
+                "lastName": last_name,
+                "companyName": company_name,
+                "jobTitle": job_title,
+                "linkedinUrl": linkedin_url,
+                "companyDomain": company_domain,
+                **variables
+            }
+        )
 
         if response.status_code != 200:
             raise Exception(response.content)
@@ -149,12 +160,11 @@ class LemListService:
             "endDate": end_date
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/v2/campaigns/{campaign_id}/stats",
-                headers=self.headers,
-                params=params
-            )
+        response = await self.client.get(
+            f"{self.base_url}/v2/campaigns/{campaign_id}/stats",
+            headers=self.headers,
+            params=params
+        )
 
         return response.json()
     
@@ -166,12 +176,11 @@ class LemListService:
             "version": "v2"
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/activities",
-                headers=self.headers,
-                params=params
-            )
+        response = await self.client.get(
+            f"{self.base_url}/activities",
+            headers=self.headers,
+            params=params
+        )
 
         return response.json()
 
@@ -182,12 +191,11 @@ class LemListService:
             "format": "json"
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/campaigns/{campaign_id}/export/leads",
-                headers=self.headers,
-                params=params
-            )
+        response = await self.client.get(
+            f"{self.base_url}/campaigns/{campaign_id}/export/leads",
+            headers=self.headers,
+            params=params
+        )
 
         return response.json()
 
@@ -197,12 +205,11 @@ class LemListService:
             variable_name: variable_value
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/leads/{lead_id}/variables",
-                headers=self.headers,
-                params=params
-            )
+        response = await self.client.post(
+            f"{self.base_url}/leads/{lead_id}/variables",
+            headers=self.headers,
+            params=params
+        )
 
         return response.json()
     
@@ -212,12 +219,11 @@ class LemListService:
             **variables
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{self.base_url}/leads/{lead_id}/variables",
-                headers=self.headers,
-                params=params
-            )
+        response = await self.client.patch(
+            f"{self.base_url}/leads/{lead_id}/variables",
+            headers=self.headers,
+            params=params
+        )
         
         print(response.content)
 
@@ -225,8 +231,7 @@ class LemListService:
 
     async def pause_campaign(self, campaign_id: str):
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
+        response = await self.client.post(
             f"{self.base_url}/campaigns/{campaign_id}/pause",
             headers=self.headers
         )
@@ -238,8 +243,7 @@ class LemListService:
 
     async def update_lead(self, campaign_id: str, lead_id: str, first_name: str, last_name: str, email_address: str):
 
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
+        response = await self.client.patch(
             f"{self.base_url}/campaigns/{campaign_id}/leads/{lead_id}",
             headers=self.headers,
             json={
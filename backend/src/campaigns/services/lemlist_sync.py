@@ -1,14 +1,40 @@
+import os
+import random
+import time
 import requests
-from typing import Dict, Any
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional
+
+# Statuses worth retrying for idempotent requests
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# POST is not idempotent: only retry when Lemlist tells us the request was not processed
+RETRYABLE_POST_STATUS_CODES = {429, 503}
 
 
 class LemListSyncService:
     """
     Synchronous LemList service for use in Celery tasks.
     Uses requests instead of httpx for synchronous HTTP calls.
+
+    Requests go through one pooled requests.Session per worker process and are retried
+    on rate limits and transient errors with exponential backoff and jitter, honouring
+    Retry-After when Lemlist sends it.
     """
     
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = 30,
+        endpoint_timeouts: Optional[Dict[str, float]] = None,
+        connect_timeout: float = 5,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30,
+        retry_after_max: float = 120,
+        pool_maxsize: int = 10
+    ):
         self.api_key = api_key
         self.headers = {
             "Content": "application/json",
@@ -16,45 +42,113 @@ class LemListSyncService:
             "Authorization": f"Basic {self.api_key}",
         }
         self.base_url = "https://api.lemlist.com/api"
-        self.timeout = 30
+        self.timeout = timeout
+        self.endpoint_timeouts = endpoint_timeouts or {}
+        self.connect_timeout = connect_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_after_max = retry_after_max
+        self.pool_maxsize = pool_maxsize
+        self._session: Optional[requests.Session] = None
+        self._session_pid: Optional[int] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled session, created per process so forked Celery workers never share sockets."""
+        if self._session is None or self._session_pid != os.getpid():
+            session = requests.Session()
+            session.headers.update(self.headers)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+            self._session_pid = os.getpid()
+        return self._session
+
+    def _timeout(self, endpoint: str) -> tuple[float, float]:
+        """(connect, read) timeout for an endpoint, keyed by service method name."""
+        return (self.connect_timeout, self.endpoint_timeouts.get(endpoint, self.timeout))
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(delay, 0), self.retry_after_max)
+
+        # Exponential backoff with full jitter
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _request(self, method: str, endpoint: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request, retrying rate limits and transient failures.
+
+        Returns the last response once it is not retryable or retries are exhausted, so
+        callers keep their own status handling.
+        """
+        retryable_status_codes = RETRYABLE_POST_STATUS_CODES if method == "POST" else RETRYABLE_STATUS_CODES
+        # A POST that timed out while reading may already have been applied
+        retryable_exceptions = (requests.ConnectTimeout,) if method == "POST" else (requests.ConnectionError, requests.Timeout)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.request(method, url, timeout=self._timeout(endpoint), **kwargs)
+            except retryable_exceptions:
+                if attempt == self.max_retries:
+                    raise
+                response = None
+            else:
+                if response.status_code not in retryable_status_codes or attempt == self.max_retries:
+                    return response
+
+            delay = self._retry_delay(attempt, response)
+            print(f"LemList {endpoint} {response.status_code if response is not None else 'connection error'}, retrying in {delay:.1f}s ({attempt + 1}/{self.max_retries})")
+            time.sleep(delay)
 
     def get_campaign(self, campaign_id: str) -> Dict[str, Any]:
         """Get campaign details."""
-        response = requests.get(
-            f"{self.base_url}/campaigns/{campaign_id}",
-            headers=self.headers,
-            timeout=self.timeout
+        response = self._request(
+            "GET",
+            "get_campaign",
+            f"{self.base_url}/campaigns/{campaign_id}"
         )
         response.raise_for_status()
         return response.json()
 
     def get_campaigns(self) -> Dict[str, Any]:
         """Get all campaigns."""
-        response = requests.get(
-            f"{self.base_url}/campaigns",
-            headers=self.headers,
-            timeout=self.timeout
+        response = self._request(
+            "GET",
+            "get_campaigns",
+            f"{self.base_url}/campaigns"
         )
         response.raise_for_status()
         return response.json()
 
     def get_campaign_sequences(self, campaign_id: str) -> Dict[str, Any]:
         """Get campaign sequences."""
-        response = requests.get(
-            f"{self.base_url}/campaigns/{campaign_id}/sequences",
-            headers=self.headers,
-            timeout=self.timeout
+        response = self._request(
+            "GET",
+            "get_campaign_sequences",
+            f"{self.base_url}/campaigns/{campaign_id}/sequences"
         )
         response.raise_for_status()
         return response.json()
 
     def create_campaign(self, name: str) -> Dict[str, Any]:
         """Create a new campaign."""
-        response = requests.post(
+        response = self._request(
+            "POST",
+            "create_campaign",
             f"{self.base_url}/campaigns",
-            headers=self.headers,
-            json={"name": name},
-            timeout=self.timeout
+            json={"name": name}
         )
         response.raise_for_status()
         return response.json()
@@ -67,16 +161,16 @@ class LemListSyncService:
         delay: int = 1
     ) -> Dict[str, Any]:
         """Create a sequence step."""
-        response = requests.post(
+        response = self._request(
+            "POST",
+            "create_sequence_step",
             f"{self.base_url}/sequences/{sequence_id}/steps",
-            headers=self.headers,
             json={
                 "type": "email",
                 "subject": subject,
                 "message": message,
                 "delay": delay
-            },
-            timeout=self.timeout
+            }
         )
         if response.status_code != 200:
             raise Exception(f"LemList API Error: {response.status_code} - {response.text}")
@@ -93,26 +187,26 @@ class LemListSyncService:
         delay: int
     ) -> Dict[str, Any]:
         """Update a sequence step."""
-        response = requests.patch(
+        response = self._request(
+            "PATCH",
+            "update_sequence_step",
             f"{self.base_url}/sequences/{sequence_id}/steps/{step_id}",
-            headers=self.headers,
             json={
                 "type": "email",
                 "subject": subject,
                 "message": message,
                 "delay": delay
-            },
-            timeout=self.timeout
+            }
         )
         response.raise_for_status()
         return response.json()
 
     def delete_sequence_step(self, sequence_id: str, step_id: str) -> Dict[str, Any]:
         """Delete a sequence step."""
-        response = requests.delete(
-            f"{self.base_url}/sequences/{sequence_id}/steps/{step_id}",
-            headers=self.headers,
-            timeout=self.timeout
+        response = self._request(
+            "DELETE",
+            "delete_sequence_step",
+            f"{self.base_url}/sequences/{sequence_id}/steps/{step_id}"
         )
         response.raise_for_status()
         return response.json()
@@ -130,9 +224,10 @@ class LemListSyncService:
         variables: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Create a lead in campaign."""
-        response = requests.post(
+        response = self._request(
+            "POST",
+            "create_lead_in_campaign",
             f"{self.base_url}/campaigns/{campaign_id}/leads/{email}", # ?deduplicate=true",
-            headers=self.headers,
             json={
                 "firstName": first_name,
                 "lastName": last_name,
@@ -141,8 +236,7 @@ class LemListSyncService:
                 "linkedinUrl": linkedin_url,
                 "companyDomain": company_domain,
                 **variables
-            },
-            timeout=self.timeout
+            }
         )
         
         if response.status_code != 200:
@@ -163,11 +257,11 @@ class LemListSyncService:
             "endDate": end_date
         }
         
-        response = requests.get(
+        response = self._request(
+            "GET",
+            "get_campaign_stats",
             f"{self.base_url}/v2/campaigns/{campaign_id}/stats",
-            headers=self.headers,
-            params=params,
-            timeout=self.timeout
+            params=params
         )
         response.raise_for_status()
         return response.json()
@@ -179,11 +273,11 @@ class LemListSyncService:
             "leadId": lead_id
         }
         
-        response = requests.get(
+        response = self._request(
+            "GET",
+            "get_lead_activities",
             f"{self.base_url}/activities",
-            headers=self.headers,
-            params=params,
-            timeout=self.timeout
+            params=params
         )
         response.raise_for_status()
         return response.json()
@@ -195,11 +289,11 @@ class LemListSyncService:
             "format": "json"
         }
         
-        response = requests.get(
+        response = self._request(
+            "GET",
+            "get_campaign_leads",
             f"{self.base_url}/campaigns/{campaign_id}/export/leads",
-            headers=self.headers,
-            params=params,
-            timeout=self.timeout
+            params=params
         )
         response.raise_for_status()
         return response.json()
@@ -215,11 +309,11 @@ class LemListSyncService:
             variable_name: variable_value
         }
         
-        response = requests.post(
+        response = self._request(
+            "POST",
+            "add_variable_to_lead",
             f"{self.base_url}/leads/{lead_id}/variables",
-            headers=self.headers,
-            params=params,
-            timeout=self.timeout
+            params=params
         )
         response.raise_for_status()
         return response.json()
@@ -1,17 +1,47 @@
 from src.workers.celery import celery_app
 from src.campaigns.services.lemlist_sync import LemListSyncService
 from src.core.database import supabase
-from src.config import LEMLIST_API_KEY
+from src.core.idempotency import task_deduplicator
+from src.config import (
+    LEMLIST_API_KEY,
+    LEMLIST_SYNC_TIMEOUT,
+    LEMLIST_SYNC_ENDPOINT_TIMEOUTS,
+    LEMLIST_SYNC_MAX_RETRIES,
+    LEMLIST_SYNC_BACKOFF_BASE,
+    LEMLIST_SYNC_BACKOFF_MAX,
+)
 from src.campaigns.utils import analyze_decision_makers
 from datetime import datetime, timedelta
 from src.campaigns.schemas import CampaignStats
 from src.candidates.schemas import ProcessingStatusEnum
 
 # Use sync service for Celery tasks
-lemlist_service = LemListSyncService(LEMLIST_API_KEY)
-
-@celery_app.task
-def create_campaign(candidate_id: int, sequence_id: str):
+lemlist_service = LemListSyncService(
+    LEMLIST_API_KEY,
+    timeout=LEMLIST_SYNC_TIMEOUT,
+    endpoint_timeouts=LEMLIST_SYNC_ENDPOINT_TIMEOUTS,
+    max_retries=LEMLIST_SYNC_MAX_RETRIES,
+    backoff_base=LEMLIST_SYNC_BACKOFF_BASE,
+    backoff_max=LEMLIST_SYNC_BACKOFF_MAX,
+)
+
+@celery_app.task(bind=True)
+def create_campaign(self, candidate_id: int, sequence_id: str, idempotency_key: str | None = None):
+    if not task_deduplicator.start(idempotency_key, self.request.id):
+        print(f"Duplicate create_campaign for candidate {candidate_id}, skipping")
+        return False
+
+    succeeded = False
+    try:
+        succeeded = populate_campaign(candidate_id, sequence_id)
+        return succeeded
+    finally:
+        task_deduplicator.finish(idempotency_key, succeeded)
+
+def populate_campaign(candidate_id: int, sequence_id: str):
+    """
+    Leads and sequence steps of the candidate's Lemlist campaign.
+    """
 
     campaign = supabase.table("candidate_lemlist_campaigns").select("*").eq("candidate_id", candidate_id).execute()
     
@@ -0,0 +1,117 @@
+from enum import StrEnum
+import base64
+import json
+from postgrest import CountMethod
+from supabase import AsyncClient, Client
+
+from .schemas import CandidatePage
+
+class CandidateProjection(StrEnum):
+    """
+    Named column sets for reads on the candidates table.
+
+    extracted_data and company_preferences are large JSON blobs, so only FULL and the
+    projections that actually need one of them select it.
+    """
+    ID = "id"
+    STATUS = "id, user_id, processing_status"
+    SUMMARY = (
+        "id, created_at, created_by, user_id, first_name, last_name, email, linkedin_url, role, "
+        "processing_status, resume_filename, resume_source, resume_handle_id, "
+        "call_transcript_id, call_transcript_filename, call_transcript_source"
+    )
+    EXTRACTION = "id, role, additional_info"
+    PREFERENCES = "id, company_preferences"
+    FULL = "*"
+
+def encode_candidate_cursor(candidate: dict) -> str:
+    """
+    Opaque keyset cursor pointing at the (created_at, id) of the last row of a page.
+    """
+    payload = json.dumps([candidate["created_at"], candidate["id"]]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+def decode_candidate_cursor(cursor: str) -> tuple[str, int]:
+    """
+    Raises:
+        ValueError: If the cursor was not produced by encode_candidate_cursor
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, candidate_id = json.loads(payload)
+        return str(created_at), int(candidate_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+class CandidateRepository:
+    """
+    Async candidate reads for the API (admin Supabase client).
+    """
+
+    def __init__(self, supabase_client: AsyncClient):
+        self.supabase = supabase_client
+
+    def _select(self, projection: CandidateProjection):
+        return self.supabase.table("candidates").select(projection.value)
+
+    async def get(self, candidate_id: int, projection: CandidateProjection = CandidateProjection.FULL) -> dict | None:
+        response = await self._select(projection).eq("id", int(candidate_id)).limit(1).execute()
+        return response.data[0] if response.data else None
+
+    async def get_by_user_id(self, user_id: str, projection: CandidateProjection = CandidateProjection.FULL) -> dict | None:
+        response = await self._select(projection).eq("user_id", user_id).limit(1).execute()
+        return response.data[0] if response.data else None
+
+    async def list_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        processing_status: str | None = None,
+        role: str | None = None,
+        created_by: str | None = None,
+        count: CountMethod | None = None,
+        projection: CandidateProjection = CandidateProjection.SUMMARY
+    ) -> CandidatePage:
+        """
+        Newest-first keyset page ordered by (created_at, id).
+
+        Seeking past the cursor instead of using OFFSET keeps every page an index range
+        scan on (created_at desc, id desc), however deep the caller pages.
+        """
+        # The cursor columns must always be selected to build the next cursor
+        columns = projection.value if projection == CandidateProjection.FULL or "created_at" in projection.value else f"{projection.value}, created_at"
+        query = self.supabase.table("candidates").select(columns, count=count)
+
+        if processing_status is not None:
+            query = query.eq("processing_status", processing_status)
+        if role is not None:
+            query = query.eq("role", role)
+        if created_by is not None:
+            query = query.eq("created_by", created_by)
+
+        if cursor is not None:
+            created_at, candidate_id = decode_candidate_cursor(cursor)
+            query = query.or_(f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt.{candidate_id})')
+
+        # One extra row tells us whether there is a next page without a second query
+        response = await query.order("created_at", desc=True).order("id", desc=True).limit(limit + 1).execute()
+
+        rows = response.data[:limit]
+        next_cursor = encode_candidate_cursor(rows[-1]) if len(response.data) > limit else None
+
+        return CandidatePage(data=rows, next_cursor=next_cursor, count=response.count)
+
+class CandidateSyncRepository:
+    """
+    Synchronous candidate reads for Celery tasks.
+    """
+
+    def __init__(self, supabase_client: Client):
+        self.supabase = supabase_client
+
+    def _select(self, projection: CandidateProjection):
+        return self.supabase.table("candidates").select(projection.value)
+
+    def get(self, candidate_id: int, projection: CandidateProjection = CandidateProjection.FULL) -> dict | None:
+        response = self._select(projection).eq("id", int(candidate_id)).limit(1).execute()
+        return response.data[0] if response.data else None
@@ -1,33 +1,70 @@
-from fastapi import APIRouter, Form, File, UploadFile, HTTPException, Depends, Body
+from fastapi import APIRouter, Form, File, UploadFile, HTTPException, Depends, Body, Query, Response
 from supabase import AsyncClient
+from postgrest import CountMethod
 from supabase_auth.errors import AuthApiError
 from src.core.database import get_supabase_admin_client
 from .schemas import ResumeSourceEnum, FileExtension, Resume, CallTranscriptSourceEnum, CallTranscript, ProcessingStatusEnum
 import json
-from .services.ashby import AshbyService
+import asyncio
+from .services.ashby import ashby_service, ResumeTooLargeError
 from .services.fathom import FathomService
-from src.config import ASHBY_API_KEY, FATHOM_API_KEY
-from .tasks import process_candidate, find_decision_makers_apollo
-from typing import Optional, Any
+from src.config import FATHOM_API_KEY
+from .services.document_store import document_store
+from .tasks import enqueue_candidate_pipeline as queue_candidate_pipeline, find_decision_makers_apollo
+from typing import Optional, Any, Literal
 import aiosmtplib
 
 from src.dependencies import AdminOrCandidate
-from src.dependencies import get_candidate_lifecycle_service
+from src.dependencies import get_candidate_lifecycle_service, get_candidate_repository
 from src.services.candidate_lifecycle_service import CandidateLifecycleService
+from .repository import CandidateRepository, CandidateProjection
 
 from src.config import EMAIL_HOSTNAME, EMAIL_PORT, EMAIL_USERNAME, EMAIL_PASSWORD
 from email.message import EmailMessage
 
-ashby_service = AshbyService(ashby_api_key=ASHBY_API_KEY)
 fathom_service = FathomService(fathom_api_key=FATHOM_API_KEY)
 
 router = APIRouter(tags=["Candidates"])
 
+async def enqueue_candidate_pipeline(candidate_id: int, resume: Resume, call_transcript: CallTranscript, company_search_strategy: str, company_domains: list[str], additional_info: str | None, role: str | None, use_llm_cache: bool = True) -> bool:
+    """
+    Queue the candidate pipeline with the documents checked into the blob store, so the broker
+    message carries their hashes rather than the file bytes. False when it was not queued.
+    """
+    if document_store is not None:
+        resume = await asyncio.to_thread(document_store.check_in_resume, resume)
+        call_transcript = await asyncio.to_thread(document_store.check_in_call_transcript, call_transcript)
+
+    # Dropped when the same inputs are already queued or were just processed (double submit)
+    return await asyncio.to_thread(queue_candidate_pipeline, int(candidate_id), resume.model_dump(), call_transcript.model_dump(), company_search_strategy, company_domains, additional_info, role, use_llm_cache)
+
 @router.get("/candidates")
-async def get_candidates(supabase_admin_client: AsyncClient = Depends(get_supabase_admin_client)):
-    candidates = await supabase_admin_client.table("candidates").select("*").execute()
+async def get_candidates(
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    processing_status: Optional[ProcessingStatusEnum] = None,
+    role: Optional[str] = None,
+    created_by: Optional[str] = None,
+    count: Optional[Literal["exact", "estimated"]] = None,
+    candidate_repository: CandidateRepository = Depends(get_candidate_repository)
+):
+    try:
+        candidates_page = await candidate_repository.list_page(
+            limit,
+            cursor=cursor,
+            processing_status=processing_status,
+            role=role,
+            created_by=created_by,
+            count=CountMethod(count) if count else None
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    return candidates
+    if candidates_page.count is not None:
+        response.headers["X-Total-Count"] = str(candidates_page.count)
+
+    return candidates_page
 
 @router.delete("/candidates/{candidate_id}")
 async def delete_candidate(candidate_id: int, lifecycle_service: CandidateLifecycleService = Depends(get_candidate_lifecycle_service)):
@@ -37,13 +74,13 @@ async def delete_candidate(candidate_id: int, lifecycle_service: CandidateLifecy
     return {"message": "Candidate deleted successfully"}
 
 @router.get("/candidates/{candidate_id}")
-async def get_candidate(candidate_id: int, supabase_admin_client: AsyncClient = Depends(get_supabase_admin_client)):
-    candidate = await supabase_admin_client.table("candidates").select("*").eq("id", int(candidate_id)).limit(1).single().execute()
+async def get_candidate(candidate_id: int, candidate_repository: CandidateRepository = Depends(get_candidate_repository)):
+    candidate = await candidate_repository.get(candidate_id, CandidateProjection.FULL)
 
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
 
-    return candidate
+    return {"data": candidate}
 
 @router.post("/candidates")
 async def create_candidate(
@@ -85,15 +122,17 @@ async def create_candidate(
         raise HTTPException(status_code=400, detail="Email already exists")
     
     if resume_source == ResumeSourceEnum.ASHBY:
-        resume_data, resume_handle_id = await ashby_service.get_resume_from_ashby(ashby_email)
-        resume_bytes: bytes = resume_data['bytes']
+        try:
+            resume_data, resume_handle_id = await ashby_service.get_resume_from_ashby(ashby_email)
+        except ResumeTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
         resume_filename = resume_data['filename']
+        # Already in the blob store when bytes is None; the task reads it by hash
+        resume = Resume(extension=FileExtension.PDF, file_bytes=resume_data['bytes'], file_sha256=resume_data['sha256'])
     elif resume_source == ResumeSourceEnum.LOCAL:
         resume_handle_id = None
-        resume_bytes: bytes = await resume_file.read()
         resume_filename = resume_file.filename
-
-    resume = Resume(extension=FileExtension.PDF, file_bytes=resume_bytes)
+        resume = Resume(extension=FileExtension.PDF, file_bytes=await resume_file.read())
 
     if call_transcript_source == CallTranscriptSourceEnum.FATHOM:
         call_transcript_text, call_transcript_title = await fathom_service.get_transcript_by_recording_id(int(call_transcript_id))
@@ -126,10 +165,7 @@ async def create_candidate(
     candidate_id = response.data[0]['id']
     print(f"Candidate ID router: {candidate_id}")
 
-    process_candidate.apply_async(
-        args=[int(candidate_id), resume.model_dump(), call_transcript.model_dump(), company_search_strategy, parsed_domains],
-        countdown=5
-    )
+    await enqueue_candidate_pipeline(candidate_id, resume, call_transcript, company_search_strategy, parsed_domains, additional_info, role)
 
     return response.data[0]
 
@@ -149,15 +185,15 @@ async def update_candidate(
     call_transcript_source: str = Form(None),
     call_transcript_id: int = Form(None),
     extracted_data: Optional[str] = Form(None),  # Added extracted_data as a form field
-    supabase_admin_client: AsyncClient = Depends(get_supabase_admin_client)
+    refresh_extraction: bool = Form(False),  # Re-ask gpt-5 instead of reusing cached answers for the same documents
+    supabase_admin_client: AsyncClient = Depends(get_supabase_admin_client),
+    candidate_repository: CandidateRepository = Depends(get_candidate_repository)
 ):
     # Get current candidate data
-    candidate = await supabase_admin_client.table("candidates").select("*").eq("id", int(candidate_id)).execute()
+    current_candidate = await candidate_repository.get(candidate_id, CandidateProjection.SUMMARY) # todo: bu candidate'i supabase_admin_client'a bağlı olarak alıyoruz.
     
-    if len(candidate.data) == 0:
+    if current_candidate is None:
         raise HTTPException(status_code=404, detail="Candidate not found")
-    
-    current_candidate = candidate.data[0] # todo: bu candidate'i supabase_admin_client'a bağlı olarak alıyoruz.
 
     # Prepare update data with only provided fields
     update_data = {}
@@ -185,13 +221,19 @@ async def update_candidate(
     # Resume File Change Conditions
     if is_resume_changed or is_call_transcript_changed: # size >0 olduğu için kesin değişiklik var. çünkü frontend'de input'lar update penceresinde her zaman boş olacak.
         if resume_source == 'ashby':
-            resume_data, resume_handle_id = await ashby_service.get_resume_from_ashby(ashby_email)
-            resume_bytes: bytes = resume_data['bytes']
+            try:
+                if not is_resume_changed and current_candidate.get("resume_source") == 'ashby' and current_candidate.get("resume_handle_id"):
+                    # Same Ashby resume as before: reuse the stored file handle (and the cached bytes)
+                    resume_data, resume_handle_id = await ashby_service.get_resume_by_handle(current_candidate["resume_handle_id"], current_candidate["resume_filename"])
+                else:
+                    resume_data, resume_handle_id = await ashby_service.get_resume_from_ashby(ashby_email)
+            except ResumeTooLargeError as e:
+                raise HTTPException(status_code=413, detail=str(e))
             resume_filename = resume_data['filename']
             update_data["resume_filename"] = resume_filename
             update_data["resume_source"] = resume_source
             update_data["resume_handle_id"] = resume_handle_id
-            resume = Resume(extension=FileExtension.PDF, file_bytes=resume_bytes)
+            resume = Resume(extension=FileExtension.PDF, file_bytes=resume_data['bytes'], file_sha256=resume_data['sha256'])
         elif resume_source == 'local':
             resume_bytes: bytes = await resume_file.read()
             resume_filename = resume_file.filename
@@ -224,14 +266,6 @@ async def update_candidate(
         print("call_transcript_file.size == 0 and call_transcript_source == 'fathom' and current_candidate.get('call_transcript_id') != call_transcript_id", call_transcript_file.size == 0 and call_transcript_source == 'fathom' and current_candidate.get('call_transcript_id') != call_transcript_id)
     
 
-    if is_resume_changed or is_call_transcript_changed:
-        update_data["processing_status"] = ProcessingStatusEnum.EXTRACTING_CANDIDATE_DATA
-        # Use default strategy and empty domains for updates since we don't have these values in update
-        process_candidate.apply_async(
-            args=[int(candidate_id), resume.model_dump(), call_transcript.model_dump(), "default", []],
-            countdown=5
-        )
-
     # Handle extracted_data updates only if the candidate is already processed
     if extracted_data is not None:
         if current_candidate.get("processing_status", ProcessingStatusEnum.NOT_STARTED) not in [ProcessingStatusEnum.NOT_STARTED, ProcessingStatusEnum.EXTRACTING_CANDIDATE_DATA, ProcessingStatusEnum.FAILED]:
@@ -257,23 +291,39 @@ async def update_candidate(
         #         }
         #     )
 
+    # Re-run extraction after the field edits are saved: the task reads additional_info and role from the row
+    if is_resume_changed or is_call_transcript_changed:
+        extraction_inputs = await candidate_repository.get(candidate_id, CandidateProjection.EXTRACTION)
+        # Use default strategy and empty domains for updates since we don't have these values in update
+        if await enqueue_candidate_pipeline(candidate_id, resume, call_transcript, "default", [], extraction_inputs["additional_info"], extraction_inputs["role"], use_llm_cache=not refresh_extraction):
+            updated_candidate = await supabase_admin_client.table("candidates").update({
+                "processing_status": ProcessingStatusEnum.EXTRACTING_CANDIDATE_DATA
+            }).eq("id", int(candidate_id)).execute()
+        else:
+            # Same inputs as a run that is queued, running or just finished; the candidate keeps its status
+            print(f"Candidate {candidate_id} update saved, extraction not re-queued (duplicate inputs)")
+
     return updated_candidate.data[0]
 
 @router.post("/candidates/{candidate_id}/send_magic_link")
-async def send_magic_link(candidate_id: int, supabase_admin_client: AsyncClient = Depends(get_supabase_admin_client)):
-    candidate = await supabase_admin_client.table("candidates").select("*").eq("id", candidate_id).execute()
+async def send_magic_link(
+    candidate_id: int,
+    supabase_admin_client: AsyncClient = Depends(get_supabase_admin_client),
+    candidate_repository: CandidateRepository = Depends(get_candidate_repository)
+):
+    candidate = await candidate_repository.get(candidate_id, CandidateProjection.SUMMARY)
 
-    if not candidate.data:
+    if candidate is None:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
     # burada status'e göre önceden bir link gönderildiyse hata dön
-    if candidate.data[0]['processing_status'] == ProcessingStatusEnum.CANDIDATE_APPROVAL_PENDING:
+    if candidate['processing_status'] == ProcessingStatusEnum.CANDIDATE_APPROVAL_PENDING:
         raise HTTPException(status_code=400, detail="Magic link has already been sent to this candidate")
 
     response = await supabase_admin_client.auth.admin.generate_link(
         {
             "type": "magiclink",
-            "email": candidate.data[0]['email'],
+            "email": candidate['email'],
             "options": {
                 "redirect_to": "https://mpc-fe-n2r5.onrender.com/auth/magic-link",
             },
@@ -282,7 +332,7 @@ async def send_magic_link(candidate_id: int, supabase_admin_client: AsyncClient
 
     msg = EmailMessage()
     msg["From"] = "talent@righthandtalent.com"
-    msg["To"] = candidate.data[0]['email']
+    msg["To"] = candidate['email']
     msg["Subject"] = "Your Company Matches Are Ready - Next Steps"
     msg.set_content(f"Click the link to login: {response.properties.action_link}")
 
@@ -292,7 +342,7 @@ async def send_magic_link(candidate_id: int, supabase_admin_client: AsyncClient
         port=EMAIL_PORT,
         username=EMAIL_USERNAME,
         password=EMAIL_PASSWORD,
-        recipients=[candidate.data[0]['email']]
+        recipients=[candidate['email']]
     )
 
     await supabase_admin_client.table("candidates").update({
@@ -312,15 +362,16 @@ async def get_company_selections(candidate_id: int, supabase_admin_client: Async
 @router.get("/me/companies")
 async def get_companies_for_candidate(
     current_user: AdminOrCandidate,
-    supabase_admin_client: AsyncClient = Depends(get_supabase_admin_client)
+    supabase_admin_client: AsyncClient = Depends(get_supabase_admin_client),
+    candidate_repository: CandidateRepository = Depends(get_candidate_repository)
 ):
     print(current_user['sub'])
-    candidate = await supabase_admin_client.table("candidates").select("*").eq("user_id", current_user['sub']).execute()
+    candidate = await candidate_repository.get_by_user_id(current_user['sub'], CandidateProjection.ID)
 
-    if len(candidate.data) == 0:
+    if candidate is None:
         raise HTTPException(status_code=404, detail="Candidate not found")
 
-    candidate_id = candidate.data[0]['id']
+    candidate_id = candidate['id']
     print(type(candidate_id))
     
     # Query candidate company selections and join with companies table
@@ -346,7 +397,8 @@ async def get_companies_for_candidate(
 async def approve_companies_for_candidate(
     current_user: AdminOrCandidate,
     selections: list[dict[str, Any]] = Body(...),
-    supabase_admin_client: AsyncClient = Depends(get_supabase_admin_client)
+    supabase_admin_client: AsyncClient = Depends(get_supabase_admin_client),
+    candidate_repository: CandidateRepository = Depends(get_candidate_repository)
 ):
     """
     Update the approval status of companies for a candidate.
@@ -356,12 +408,12 @@ async def approve_companies_for_candidate(
         selections: List of objects with company_id and approved_by_candidate fields
     """
     # Verify the candidate exists
-    candidate = await supabase_admin_client.table("candidates").select("id").eq("user_id", current_user['sub']).execute()
+    candidate = await candidate_repository.get_by_user_id(current_user['sub'], CandidateProjection.ID)
     
-    if len(candidate.data) == 0:
+    if candidate is None:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    candidate_id = candidate.data[0]['id']
+    candidate_id = candidate['id']
     
     # Update each company selection
     for selection in selections:
@@ -9,12 +9,15 @@ class FileExtension(StrEnum):
 
 class Resume(BaseModel):
     extension: FileExtension
-    file_bytes: bytes
+    file_bytes: bytes | None
+    # Set instead of file_bytes when the document was checked into the DocumentStore
+    file_sha256: str | None = None
 
 class CallTranscript(BaseModel):
     extension: FileExtension
     file_bytes: bytes | None
     content: str | None
+    file_sha256: str | None = None
 
 class ProcessingStatusEnum(StrEnum):
     NOT_STARTED = "not_started"
@@ -39,3 +42,8 @@ class ResumeSourceEnum(StrEnum):
 class CallTranscriptSourceEnum(StrEnum):
     FATHOM = "fathom"
     LOCAL = "local"
+
+class CandidatePage(BaseModel):
+    data: list[dict]
+    next_cursor: str | None = None
+    count: int | None = None
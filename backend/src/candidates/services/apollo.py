@@ -1,10 +1,13 @@
 from enum import StrEnum
-from datetime import datetime
+from datetime import datetime, timezone
 from pydantic import BaseModel, Field
 from pydantic_extra_types.pendulum_dt import DateTime
 from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
 import requests
 
+from src.core.rate_limit import get_rate_limiter
+
 
 # APOLLO TASKS
 class EnrichedOrganization(BaseModel):
@@ -39,7 +42,8 @@ class EnrichedOrganization(BaseModel):
     technology_names: list[str] | None = None
     departmental_head_count: dict | None = None
     apollo_id: str = Field(default=None, alias='id')
-    updated_at: DateTime = datetime.now()
+    # Stamped per instance; the enrichment cache judges freshness by it
+    updated_at: DateTime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class CompanySearchStrategy(StrEnum):
     SMART = "default"
@@ -82,6 +86,7 @@ class EnrichedPerson(BaseModel):
     seniority: str | None = None
     email_domain_catchall: bool | None = None
     apollo_id: str = Field(default=None, alias='id')
+    updated_at: DateTime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 def convert_funding_stage_to_apollo(funding_stages: list):
     FUNDING_STAGE_APOLLO_MAPPING = {
@@ -103,8 +108,20 @@ def convert_funding_stage_to_apollo(funding_stages: list):
 
     return [FUNDING_STAGE_APOLLO_MAPPING[funding_stage] for funding_stage in funding_stages if funding_stage in FUNDING_STAGE_APOLLO_MAPPING.keys()]
 
+# people/bulk_match accepts at most 10 people per request
+PEOPLE_BULK_MATCH_MAX_DETAILS = 10
+
 class ApolloService:
-    def __init__(self, apollo_api_key: str):
+    def __init__(
+        self,
+        apollo_api_key: str,
+        max_workers: int = 8,
+        requests_per_minute: float = 200,
+        burst: int = 20,
+        search_target_count: int = 20,
+        search_per_page: int = 20,
+        search_max_pages: int = 5
+    ):
         self.api_key = apollo_api_key
         self.headers = {
             "accept": "application/json",
@@ -112,96 +129,119 @@ class ApolloService:
             "Content-Type": "application/json",
             "x-api-key": self.api_key
         }
-
-    def search_organizations(self, locations: list[str], keyword_tags: list[str], funding_stages: list[str], domains: list[str], company_search_strategy: str):
+        self.base_url = "https://api.apollo.io/api/v1"
+        self.max_workers = max_workers
+        self.search_target_count = search_target_count
+        self.search_per_page = search_per_page
+        self.search_max_pages = search_max_pages
+        # Apollo rate limits per API key, so every service instance using the key shares one budget
+        self.rate_limiter = get_rate_limiter(f"apollo:{self.api_key}", requests_per_minute, burst)
+
+    def search_organization_pages(self, locations: list[str], keyword_tags: list[str], funding_stages: list[str], domains: list[str], company_search_strategy: str):
+        """
+        Yield (apollo_id, domain) pages as they arrive from mixed_companies/search.
+
+        Paging stops once target_count unique domains were yielded, max_pages were fetched
+        or Apollo runs out of results, so callers can start enriching a page while the
+        next one is requested.
+        """
 
         print(f"Company Search Strategy: {company_search_strategy}")
 
-        base_url = "https://api.apollo.io/api/v1/mixed_companies/search"
-        
-        if company_search_strategy == CompanySearchStrategy.SMART:
+        if company_search_strategy == CompanySearchStrategy.MANUAL:
+            yield list(dict.fromkeys((None, domain) for domain in domains if domain))
+            return
 
-            if len(locations) == 1 and locations[0] == "remote":
-                locations = []
-            
-            params = SearchOrganizationParams(
-                organization_locations=locations,
-                q_organization_keyword_tags=keyword_tags,
-                page=1,
-                per_page=20,
-                organization_latest_funding_stage_cd=funding_stages
-            )
+        if len(locations) == 1 and locations[0] == "remote":
+            locations = []
 
-            query_string = urlencode(params.model_dump(by_alias=True), doseq=True)
-            url = f"{base_url}?{query_string}"
-            
-            try:
-                response = requests.post(url, headers=self.headers)
-                response.raise_for_status()
-            except Exception as e:
-                raise Exception(f"Failed to search organizations: {e}")
+        seen_domains = set()
 
-            apollo_organization_domains = [(organization['id'], organization['primary_domain']) for organization in response.json()['organizations'] if 'primary_domain' in organization]
-
-        elif company_search_strategy == CompanySearchStrategy.HYBRID:
-
-            if len(locations) == 1 and locations[0] == "remote":
-                locations = []
+        for page in range(1, self.search_max_pages + 1):
 
             params = SearchOrganizationParams(
                 organization_locations=locations,
                 q_organization_keyword_tags=keyword_tags,
-                page=1,
-                per_page=20,
+                page=page,
+                per_page=self.search_per_page,
                 organization_latest_funding_stage_cd=funding_stages
             )
 
-            query_string = urlencode(params.model_dump(by_alias=True), doseq=True)
-            url = f"{base_url}?{query_string}"
+            url = f"{self.base_url}/mixed_companies/search?{urlencode(params.model_dump(by_alias=True), doseq=True)}"
 
             try:
+                self.rate_limiter.acquire()
                 response = requests.post(url, headers=self.headers)
                 response.raise_for_status()
             except Exception as e:
                 raise Exception(f"Failed to search organizations: {e}")
 
-            apollo_organization_domains = [(organization['id'], organization['primary_domain']) for organization in response.json()['organizations'] if 'primary_domain' in organization]
+            organizations = response.json()['organizations']
 
-        elif company_search_strategy == CompanySearchStrategy.MANUAL:
+            organization_domains = []
+            for organization in organizations:
+                domain = organization.get('primary_domain')
+                if domain and domain not in seen_domains and len(seen_domains) < self.search_target_count:
+                    seen_domains.add(domain)
+                    organization_domains.append((organization['id'], domain))
 
-            apollo_organization_domains = [(None, domain) for domain in domains]
+            if organization_domains:
+                yield organization_domains
 
-        organization_domains = list(set([(id, domain) for id, domain in apollo_organization_domains if domain]))
+            total_pages = response.json().get('pagination', {}).get('total_pages', page)
+            if len(seen_domains) >= self.search_target_count or len(organizations) < self.search_per_page or page >= total_pages:
+                return
+
+    def search_organizations(self, locations: list[str], keyword_tags: list[str], funding_stages: list[str], domains: list[str], company_search_strategy: str):
 
-        return organization_domains
+        return [
+            organization_domain
+            for page in self.search_organization_pages(locations, keyword_tags, funding_stages, domains, company_search_strategy)
+            for organization_domain in page
+        ]
         
-    def enrich_organizations(self, organization_domains: list[str]):
+    def enrich_organization(self, domain: str):
+
+        url = f"{self.base_url}/organizations/enrich?{urlencode({'domain': domain})}"
+
+        self.rate_limiter.acquire()
+        response = requests.post(url, headers=self.headers)
+        response.raise_for_status()
 
-        base_url = "https://api.apollo.io/api/v1/organizations/enrich"
+        if response.status_code == 200 and 'organization' in response.json():
+            return EnrichedOrganization(**response.json()['organization']).model_dump(mode='json')
 
-        enriched_organization_data = []
-        for domain in organization_domains:
-            params = {
-            "domain": domain,
-            }
+        return None
+
+    def enrich_organizations(self, organization_domains: list[str]):
+        """
+        Enrich domains concurrently (bounded by max_workers and the per-key rate limit).
 
-            query_string = urlencode(params, doseq=True)
-            url = f"{base_url}?{query_string}"
+        A failing domain is logged and skipped so the organizations already enriched are
+        kept; only when every domain fails is the error raised.
+        """
+        if not organization_domains:
+            return []
 
+        def enrich(domain: str):
             try:
-                response = requests.post(url, headers=self.headers)
-                response.raise_for_status()
+                return self.enrich_organization(domain), None
             except Exception as e:
-                raise Exception(f"Failed to enrich organizations: {e}")
+                print(f"Failed to enrich organization {domain}: {e}")
+                return None, e
 
-            if response.status_code == 200 and 'organization' in response.json():
-                enriched_organization_data.append(EnrichedOrganization(**response.json()['organization']).model_dump(mode='json'))
-        
-        return enriched_organization_data
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(organization_domains))) as executor:
+            results = list(executor.map(enrich, organization_domains))
+
+        errors = [error for _, error in results if error is not None]
+        if len(errors) == len(organization_domains):
+            raise Exception(f"Failed to enrich organizations: {errors[0]}")
+
+        return [organization for organization, _ in results if organization is not None]
     
     def search_people_organizations(self, organization_ids: list[str]):
 
-        base_url = "https://api.apollo.io/api/v1/mixed_people/api_search"
+        base_url = f"{self.base_url}/mixed_people/api_search"
 
         params = SearchPeopleParams(
             organization_ids=organization_ids,
@@ -222,33 +262,47 @@ class ApolloService:
 
         return people_apollo_ids
         
-    def enrich_people(self, people_ids: list[str]):
+    def enrich_people_chunk(self, people_ids: list[str]):
 
-        base_url = "https://api.apollo.io/api/v1/people/bulk_match"
+        params = EnrichPeopleParams(
+            reveal_personal_emails=True,
+            reveal_phone_number=False
+        )
 
-        chunk_size = 10
-        enriched_people = []
+        payload = {
+            "details": [{"id": person_apollo_id} for person_apollo_id in people_ids]
+        }
 
-        for i in range(0, len(people_ids), chunk_size):
+        url = f"{self.base_url}/people/bulk_match?{urlencode(params.model_dump(), doseq=True)}"
 
-            params = EnrichPeopleParams(
-                reveal_personal_emails=True,
-                reveal_phone_number=False
-            )
+        self.rate_limiter.acquire()
+        response = requests.post(url, headers=self.headers, json=payload)
+        response.raise_for_status()
 
-            payload = {
-                "details": [{"id": person_apollo_id} for person_apollo_id in people_ids[i:i+chunk_size]]
-            }
-
-            query_string = urlencode(params.model_dump(), doseq=True)
-            url = f"{base_url}?{query_string}"
+        return [EnrichedPerson(**person).model_dump(mode='json') for person in response.json()['matches']]
 
+    def enrich_people(self, people_ids: list[str]):
+        """
+        Enrich people in chunks of PEOPLE_BULK_MATCH_MAX_DETAILS, run concurrently under the
+        per-key rate limit. Like enrich_organizations, a failing chunk is skipped unless all fail.
+        """
+        people_ids = list(dict.fromkeys(people_ids))
+        chunks = [people_ids[i:i + PEOPLE_BULK_MATCH_MAX_DETAILS] for i in range(0, len(people_ids), PEOPLE_BULK_MATCH_MAX_DETAILS)]
+        if not chunks:
+            return []
+
+        def enrich(chunk: list[str]):
             try:
-                response = requests.post(url, headers=self.headers, json=payload)
-                response.raise_for_status()
+                return self.enrich_people_chunk(chunk), None
             except Exception as e:
-                raise Exception(f"Failed to enrich people: {e}")
+                print(f"Failed to enrich {len(chunk)} people: {e}")
+                return [], e
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+            results = list(executor.map(enrich, chunks))
 
-            enriched_people.extend([EnrichedPerson(**person).model_dump(mode='json') for person in response.json()['matches']])
+        errors = [error for _, error in results if error is not None]
+        if len(errors) == len(chunks):
+            raise Exception(f"Failed to enrich people: {errors[0]}")
 
-        return enriched_people
+        return [person for people, _ in results for person in people]
@@ -0,0 +1,187 @@
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+import json
+import redis
+from redis import Redis
+from postgrest.exceptions import APIError
+from supabase import Client
+
+ORGANIZATION_COLUMNS = "id, apollo_id, primary_domain, updated_at"
+
+# PostgREST errors for a column the table does not have (filter / write)
+UNDEFINED_COLUMN_CODES = ("42703", "PGRST204")
+
+def normalize_domain(domain: str) -> str:
+    """
+    "https://WWW.Stripe.com/about" -> "stripe.com", the form Apollo stores as primary_domain.
+    """
+    domain = domain.strip().lower()
+    host = urlsplit(domain if "//" in domain else f"//{domain}").hostname or ""
+    host = host.rstrip(".")
+    return host[4:] if host.startswith("www.") else host
+
+class EnrichmentCacheCounters:
+    """
+    Hit/miss counters of an enrichment cache: per process, plus cluster-wide totals in Redis.
+    """
+
+    HITS_KEY: str
+    MISSES_KEY: str
+    NAME: str
+
+    def __init__(self, redis_client: Redis | None = None):
+        self.redis = redis_client
+        self.hits = 0
+        self.misses = 0
+
+    def _count(self, hits: int, misses: int):
+        self.hits += hits
+        self.misses += misses
+        print(f"{self.NAME} cache: {hits} hits, {misses} misses")
+
+        if self.redis is not None:
+            try:
+                pipeline = self.redis.pipeline(transaction=False)
+                pipeline.incrby(self.HITS_KEY, hits)
+                pipeline.incrby(self.MISSES_KEY, misses)
+                pipeline.execute()
+            except redis.RedisError as e:
+                print(f"{self.NAME} cache Redis counters failed: {e}")
+
+    def stats(self) -> dict:
+        stats = {"hits": self.hits, "misses": self.misses}
+        if self.redis is not None:
+            try:
+                total_hits, total_misses = self.redis.mget([self.HITS_KEY, self.MISSES_KEY])
+                stats["total_hits"] = int(total_hits or 0)
+                stats["total_misses"] = int(total_misses or 0)
+            except redis.RedisError as e:
+                print(f"{self.NAME} cache Redis counters failed: {e}")
+        return stats
+
+class OrganizationEnrichmentCache(EnrichmentCacheCounters):
+    """
+    Read-through cache of enriched Apollo organizations keyed by normalized domain.
+
+    companies_apollo is the source of truth: a row whose updated_at is within the TTL is
+    fresh and skips the Apollo call. An optional Redis layer in front of it saves the
+    table lookup for organizations enriched recently by any worker.
+    """
+
+    HITS_KEY = "apollo:organization_cache:hits"
+    MISSES_KEY = "apollo:organization_cache:misses"
+    NAME = "Organization"
+
+    def __init__(self, supabase_client: Client, ttl_seconds: int, redis_client: Redis | None = None):
+        super().__init__(redis_client)
+        self.supabase = supabase_client
+        self.ttl_seconds = ttl_seconds
+
+    def _redis_key(self, domain: str) -> str:
+        return f"apollo:organization:{domain}"
+
+    def get_many(self, domains: list[str]) -> dict[str, dict]:
+        """
+        Fresh companies_apollo rows (id, apollo_id, primary_domain, updated_at) by normalized domain.
+        """
+        domains = list({normalize_domain(domain) for domain in domains if domain})
+        cached = {}
+
+        if self.redis is not None and domains:
+            try:
+                for domain, value in zip(domains, self.redis.mget([self._redis_key(domain) for domain in domains])):
+                    if value is not None:
+                        cached[domain] = json.loads(value)
+            except redis.RedisError as e:
+                print(f"Organization cache Redis read failed: {e}")
+
+        missing = [domain for domain in domains if domain not in cached]
+        if missing:
+            fresh_after = datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+            response = self.supabase.table("companies_apollo").select(ORGANIZATION_COLUMNS).in_("primary_domain", missing).gte("updated_at", fresh_after.isoformat()).execute()
+            from_table = {normalize_domain(row["primary_domain"]): row for row in response.data}
+            cached.update(from_table)
+            self._set_redis(from_table.values())
+
+        self._count(hits=len(cached), misses=len(domains) - len(cached))
+        return cached
+
+    def set_many(self, organizations: list[dict]):
+        """
+        Record freshly enriched companies_apollo rows in the Redis layer.
+        """
+        self._set_redis(organizations)
+
+    def _set_redis(self, organizations):
+        if self.redis is None:
+            return
+        try:
+            pipeline = self.redis.pipeline(transaction=False)
+            for organization in organizations:
+                if not organization.get("primary_domain"):
+                    continue
+                # Expire together with the table row so Redis never outlives the TTL
+                expires_in = self.ttl_seconds - self._age_seconds(organization.get("updated_at"))
+                if expires_in <= 0:
+                    continue
+                row = {column: organization.get(column) for column in ORGANIZATION_COLUMNS.split(", ")}
+                pipeline.set(self._redis_key(normalize_domain(organization["primary_domain"])), json.dumps(row), ex=int(expires_in))
+            pipeline.execute()
+        except redis.RedisError as e:
+            print(f"Organization cache Redis write failed: {e}")
+
+    def _age_seconds(self, updated_at: str | None) -> float:
+        try:
+            updated_at = datetime.fromisoformat(updated_at)
+        except (TypeError, ValueError):
+            return 0
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        return max((datetime.now(timezone.utc) - updated_at).total_seconds(), 0)
+
+class PersonEnrichmentCache(EnrichmentCacheCounters):
+    """
+    Skips people/bulk_match for people already held in company_decision_makers_apollo.
+
+    Decision makers are shared between candidates who approved the same company, so a
+    row whose updated_at is within the TTL is reused instead of spending credits again.
+
+    On a database without company_decision_makers_apollo.updated_at (see the README) nothing
+    is fresh and the column is left out of the rows written.
+    """
+
+    HITS_KEY = "apollo:person_cache:hits"
+    MISSES_KEY = "apollo:person_cache:misses"
+    NAME = "Person"
+
+    def __init__(self, supabase_client: Client, ttl_seconds: int, redis_client: Redis | None = None):
+        super().__init__(redis_client)
+        self.supabase = supabase_client
+        self.ttl_seconds = ttl_seconds
+        self.updated_at_supported = True
+
+    def get_fresh_ids(self, people_apollo_ids: list[str]) -> set[str]:
+        people_apollo_ids = list(dict.fromkeys(people_apollo_ids))
+        if not people_apollo_ids:
+            return set()
+
+        fresh_ids = set()
+        if self.updated_at_supported:
+            fresh_after = datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+            try:
+                response = self.supabase.table("company_decision_makers_apollo").select("apollo_id").in_("apollo_id", people_apollo_ids).gte("updated_at", fresh_after.isoformat()).execute()
+                fresh_ids = {person["apollo_id"] for person in response.data}
+            except APIError as e:
+                if e.code not in UNDEFINED_COLUMN_CODES:
+                    raise
+                print(f"company_decision_makers_apollo has no updated_at column, enriching every person: {e.message}")
+                self.updated_at_supported = False
+
+        self._count(hits=len(fresh_ids), misses=len(people_apollo_ids) - len(fresh_ids))
+        return fresh_ids
+
+    def table_rows(self, decision_makers: list[dict]) -> list[dict]:
+        """Decision maker rows as written to company_decision_makers_apollo (without updated_at when the column is missing)."""
+        if self.updated_at_supported:
+            return decision_makers
+        return [{column: value for column, value in decision_maker.items() if column != "updated_at"} for decision_maker in decision_makers]
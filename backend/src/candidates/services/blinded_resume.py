@@ -3,9 +3,8 @@ from typing import Union
 from enum import Enum
 from openai import OpenAI
 
-from ..schemas import Resume, CallTranscript, FileExtension
-
-from ..utils import read_fathom_pdf_file, read_ashby_pdf_file, generate_random_chars
+from ..utils import generate_random_chars
+from .llm_cache import LLMResponseCache, parse_response
 
 class QualificationMatchCOS(BaseModel):
     ability_to_scale: list[str] = Field(..., description="How the candidate has built and scaled teams, systems, or business functions")
@@ -824,39 +823,24 @@ career_goals:
 """
 
 class BlindedResumeService:
-    def __init__(self, openai_client: OpenAI, openai_model: str):
+    def __init__(self, openai_client: OpenAI, openai_model: str, llm_cache: LLMResponseCache | None = None):
         self.openai_client = openai_client
         self.openai_model = openai_model
+        self.llm_cache = llm_cache
 
-    def create_blinded_resume(self, resume: Resume, call_transcript: CallTranscript, additional_info: str, role: str):
-        
-        if resume.extension == FileExtension.PDF:
-            resume_content = read_ashby_pdf_file(resume.file_bytes)
-
-        if call_transcript.extension == FileExtension.PDF:
-            call_transcript_content = read_fathom_pdf_file(call_transcript.file_bytes)
-        elif call_transcript.extension == FileExtension.STR:
-            call_transcript_content = call_transcript.content
-
+    def create_blinded_resume(self, resume_content: str, call_transcript_content: str, additional_info: str, role: str, use_cache: bool = True):
         prompt = f"Call Transcript:\n{call_transcript_content}\n\nResume:\n{resume_content}\n\nAdditional Info: {additional_info}"
 
-        response = self.openai_client.responses.parse(
-            model=self.openai_model,
-            input=[
-                {
-                    "role": "system",
-                    "content": system_prompt_cos if role == "COS" else system_prompt_engineering if role == "ENGINEERING" else system_prompt_product if role == "PRODUCT" else system_prompt_marketing if role == "MARKETING" else system_prompt_revenue if role == "REVENUE" else system_prompt_operations if role == "OPERATIONS" else None
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            text_format=CandidateResumeCOS if role == "COS" else CandidateResumeEngineering if role == "ENGINEERING" else CandidateResumeProduct if role == "PRODUCT" else CandidateResumeMarketing if role == "MARKETING" else CandidateResumeRevenue if role == "REVENUE" else CandidateResumeOperations if role == "OPERATIONS" else None
+        candidate_resume: Union[CandidateResumeCOS, CandidateResumeEngineering, CandidateResumeProduct, CandidateResumeMarketing, CandidateResumeRevenue, CandidateResumeOperations] = parse_response(
+            self.openai_client,
+            self.openai_model,
+            system_prompt_cos if role == "COS" else system_prompt_engineering if role == "ENGINEERING" else system_prompt_product if role == "PRODUCT" else system_prompt_marketing if role == "MARKETING" else system_prompt_revenue if role == "REVENUE" else system_prompt_operations if role == "OPERATIONS" else None,
+            prompt,
+            CandidateResumeCOS if role == "COS" else CandidateResumeEngineering if role == "ENGINEERING" else CandidateResumeProduct if role == "PRODUCT" else CandidateResumeMarketing if role == "MARKETING" else CandidateResumeRevenue if role == "REVENUE" else CandidateResumeOperations if role == "OPERATIONS" else None,
+            self.llm_cache,
+            use_cache
         )
 
-        candidate_resume: Union[CandidateResumeCOS, CandidateResumeEngineering, CandidateResumeProduct, CandidateResumeMarketing, CandidateResumeRevenue, CandidateResumeOperations] = response.output_parsed
-
         candidate_resume.candidate_first_name = "RHT" + generate_random_chars(3)
         candidate_resume.candidate_last_name = ""
 
@@ -3,8 +3,7 @@ from typing import Union
 from enum import Enum
 from openai import OpenAI
 
-from ..schemas import Resume, CallTranscript, FileExtension
-from ..utils import read_fathom_pdf_file, read_ashby_pdf_file
+from .llm_cache import LLMResponseCache, parse_response
 
 class FundingStageEnum(str, Enum):
     PRE_SEED = "pre_seed"
@@ -561,36 +560,22 @@ Categories (INCORRECT format - do not use):
 """
 
 class CandidatePreferencesService:
-    def __init__(self, openai_client: OpenAI, openai_model: str):
+    def __init__(self, openai_client: OpenAI, openai_model: str, llm_cache: LLMResponseCache | None = None):
         self.openai_client = openai_client
         self.openai_model = openai_model
+        self.llm_cache = llm_cache
 
-    def extract_candidate_preferences(self, resume: Resume, call_transcript: CallTranscript, additional_info: str):
-        if resume.extension == FileExtension.PDF:
-            resume_content = read_ashby_pdf_file(resume.file_bytes)
-
-        if call_transcript.extension == FileExtension.PDF:
-            call_transcript_content = read_fathom_pdf_file(call_transcript.file_bytes)
-        elif call_transcript.extension == FileExtension.STR:
-            call_transcript_content = call_transcript.content
-
+    def extract_candidate_preferences(self, resume_content: str, call_transcript_content: str, additional_info: str, use_cache: bool = True):
         prompt = f"Call Transcript:\n{call_transcript_content}\n\nResume:\n{resume_content}\n\nAdditional Info: {additional_info}"
 
-        response = self.openai_client.responses.parse(
-            model=self.openai_model,
-            input=[
-                {
-                    "role": "system",
-                    "content": system_prompt
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            text_format=CompanyPreferences
+        company_preferences: CompanyPreferences = parse_response(
+            self.openai_client,
+            self.openai_model,
+            system_prompt,
+            prompt,
+            CompanyPreferences,
+            self.llm_cache,
+            use_cache
         )
 
-        company_preferences: CompanyPreferences = response.output_parsed
-
         return company_preferences.model_dump()
@@ -0,0 +1,50 @@
+import json
+
+from src.core.blob_store import BlobStore
+
+class StageCheckpoints:
+    """
+    Intermediate outputs of a pipeline task, kept in the blob store under its Celery task id.
+
+    A retry keeps the task id, so it finds the outputs of the steps that already succeeded
+    (LLM results, Apollo search pages, enriched organizations and people) and continues from
+    there instead of paying for them again. Cleared once the task succeeds or finally fails.
+    Without a blob store nothing is checkpointed.
+    """
+
+    def __init__(self, blob_store: BlobStore | None):
+        self.blob_store = blob_store
+
+    def _key(self, task_id: str, stage: str) -> str:
+        return f"checkpoints/{task_id}/{stage}.json"
+
+    def get(self, task_id: str, stage: str):
+        if self.blob_store is None:
+            return None
+        # An unreadable checkpoint means the stage runs again, not that the task fails
+        try:
+            checkpoint = self.blob_store.get(self._key(task_id, stage))
+        except Exception as e:
+            print(f"Checkpoint read failed for {stage} of task {task_id}: {e}")
+            return None
+        if checkpoint is None:
+            return None
+        print(f"Resuming {stage} from checkpoint of task {task_id}")
+        return json.loads(checkpoint)
+
+    def put(self, task_id: str, stage: str, value):
+        if self.blob_store is None:
+            return
+        try:
+            self.blob_store.put(self._key(task_id, stage), json.dumps(value).encode(), "application/json")
+        except Exception as e:
+            print(f"Checkpoint write failed for {stage} of task {task_id}: {e}")
+
+    def clear(self, task_id: str, stages: list[str]):
+        if self.blob_store is None:
+            return
+        for stage in stages:
+            try:
+                self.blob_store.delete(self._key(task_id, stage))
+            except Exception as e:
+                print(f"Checkpoint cleanup failed for {stage} of task {task_id}: {e}")
@@ -0,0 +1,74 @@
+import hashlib
+
+from src.core.blob_store import BlobStore, blob_store
+from ..schemas import Resume, CallTranscript, FileExtension
+from .resume_cache import ResumeCache
+
+class DocumentNotFoundError(Exception):
+    pass
+
+class DocumentStore:
+    """
+    Claim check for the documents handed to Celery tasks.
+
+    The API writes the resume and call transcript to the blob store and enqueues them with
+    only their content hash, so broker messages stay small whatever the upload size. The task
+    reads them back by hash. Resumes share the ResumeCache layout, so an Ashby resume that was
+    already cached is not written twice.
+    """
+
+    def __init__(self, blob_store: BlobStore):
+        self.blob_store = blob_store
+        self.resume_cache = ResumeCache(blob_store)
+
+    def _call_transcript_key(self, sha256: str, extension: FileExtension) -> str:
+        return f"call_transcripts/sha256/{sha256}.{extension}"
+
+    def check_in_resume(self, resume: Resume) -> Resume:
+        if resume.file_bytes is None:
+            return resume
+
+        sha256 = self.resume_cache.put(resume.file_bytes)
+        return Resume(extension=resume.extension, file_bytes=None, file_sha256=sha256)
+
+    def check_out_resume(self, resume: Resume) -> Resume:
+        if resume.file_sha256 is None:
+            return resume
+
+        resume_bytes = self.resume_cache.get_by_hash(resume.file_sha256)
+        if resume_bytes is None:
+            raise DocumentNotFoundError(f"Resume {resume.file_sha256} is not in the blob store")
+
+        return Resume(extension=resume.extension, file_bytes=resume_bytes, file_sha256=resume.file_sha256)
+
+    def check_in_call_transcript(self, call_transcript: CallTranscript) -> CallTranscript:
+        # Fathom transcripts arrive as text; both forms are stored as bytes
+        if call_transcript.extension == FileExtension.STR:
+            data = call_transcript.content.encode() if call_transcript.content is not None else None
+        else:
+            data = call_transcript.file_bytes
+
+        if data is None:
+            return call_transcript
+
+        sha256 = hashlib.sha256(data).hexdigest()
+        key = self._call_transcript_key(sha256, call_transcript.extension)
+        if not self.blob_store.exists(key):
+            self.blob_store.put(key, data)
+
+        return CallTranscript(extension=call_transcript.extension, file_bytes=None, content=None, file_sha256=sha256)
+
+    def check_out_call_transcript(self, call_transcript: CallTranscript) -> CallTranscript:
+        if call_transcript.file_sha256 is None:
+            return call_transcript
+
+        data = self.blob_store.get(self._call_transcript_key(call_transcript.file_sha256, call_transcript.extension))
+        if data is None:
+            raise DocumentNotFoundError(f"Call transcript {call_transcript.file_sha256} is not in the blob store")
+
+        if call_transcript.extension == FileExtension.STR:
+            return CallTranscript(extension=call_transcript.extension, file_bytes=None, content=data.decode(), file_sha256=call_transcript.file_sha256)
+        return CallTranscript(extension=call_transcript.extension, file_bytes=data, content=None, file_sha256=call_transcript.file_sha256)
+
+# Without a blob store the documents keep travelling inline in the task arguments
+document_store = DocumentStore(blob_store) if blob_store is not None else None
@@ -0,0 +1,104 @@
+import hashlib
+import json
+from typing import TypeVar
+from openai import OpenAI
+from pydantic import BaseModel
+
+from src.core.blob_store import BlobStore
+
+# Bump to drop every cached response at once (e.g. after a change to how outputs are post-processed)
+LLM_CACHE_VERSION = "v1"
+
+ParsedOutput = TypeVar("ParsedOutput", bound=BaseModel)
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+class LLMResponseCache:
+    """
+    Parsed structured-output responses, keyed by model, system prompt, user input and output schema.
+
+    A response depends only on those four, so rerunning a candidate on unchanged documents
+    returns the stored output instead of calling the model again. Editing a prompt or a
+    schema changes the key and misses naturally.
+    """
+
+    def __init__(self, blob_store: BlobStore):
+        self.blob_store = blob_store
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, model: str, system_prompt: str, user_input: str, text_format: type[BaseModel]) -> str:
+        schema_hash = _sha256(json.dumps(text_format.model_json_schema(), sort_keys=True))
+        request_hash = _sha256("\n".join([model, _sha256(system_prompt), _sha256(user_input), schema_hash]))
+        return f"llm/{LLM_CACHE_VERSION}/{text_format.__name__}/{request_hash}.json"
+
+    def get(self, key: str, text_format: type[ParsedOutput]) -> ParsedOutput | None:
+        # An unreachable store is a miss; the model is asked instead
+        try:
+            cached_output = self.blob_store.get(key)
+        except Exception as e:
+            print(f"LLM cache read failed for {key}: {e}")
+            cached_output = None
+
+        if cached_output is None:
+            self.misses += 1
+            return None
+
+        try:
+            parsed_output = text_format.model_validate_json(cached_output)
+        except ValueError as e:
+            print(f"LLM cache entry {key} is unreadable, ignoring it: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return parsed_output
+
+    def put(self, key: str, parsed_output: BaseModel):
+        # The response is already paid for; losing the cache entry must not fail (and retry) the task
+        try:
+            self.blob_store.put(key, parsed_output.model_dump_json().encode(), "application/json")
+        except Exception as e:
+            print(f"LLM cache write failed for {key}: {e}")
+
+def parse_response(openai_client: OpenAI,
+                   model: str,
+                   system_prompt: str,
+                   user_input: str,
+                   text_format: type[ParsedOutput],
+                   llm_cache: LLMResponseCache | None = None,
+                   use_cache: bool = True) -> ParsedOutput:
+    """
+    openai_client.responses.parse through the optional cache. use_cache=False skips the lookup
+    and overwrites the stored response with the fresh one.
+    """
+    key = llm_cache.key(model, system_prompt, user_input, text_format) if llm_cache is not None else None
+
+    if key is not None and use_cache:
+        cached_output = llm_cache.get(key, text_format)
+        if cached_output is not None:
+            return cached_output
+
+    response = openai_client.responses.parse(
+        model=model,
+        input=[
+            {
+                "role": "system",
+                "content": system_prompt
+            },
+            {
+                "role": "user",
+                "content": user_input
+            }
+        ],
+        text_format=text_format
+    )
+
+    parsed_output: ParsedOutput = response.output_parsed
+
+    # A refusal has no parsed output and must not be cached
+    if key is not None and parsed_output is not None:
+        llm_cache.put(key, parsed_output)
+
+    return parsed_output
@@ -0,0 +1,168 @@
+import io
+import re
+import threading
+import time
+import billiard
+from billiard.exceptions import TimeoutError as PoolTimeoutError
+from billiard.pool import Pool
+from typing import Iterator
+from pydantic import BaseModel
+from pypdf import PdfReader
+
+class PdfLimitExceededError(Exception):
+    pass
+
+class PdfPageText(BaseModel):
+    page_number: int
+    text: str
+    seconds: float
+
+def normalize_whitespace(text: str) -> str:
+    """
+    Normalize whitespace in extracted text (newlines and runs of spaces become single spaces).
+    """
+    if not text:
+        return ""
+    return re.sub(r'\s+', ' ', text).strip()
+
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> list[tuple[int, str, float]]:
+    """
+    Text of pages [start, stop) with the time each page took. Runs in a pool worker process.
+    """
+    pdf_reader = PdfReader(io.BytesIO(pdf_bytes))
+    pages = []
+    for page_index in range(start, stop):
+        page_start = time.perf_counter()
+        page_text = pdf_reader.pages[page_index].extract_text() or ""
+        pages.append((page_index + 1, page_text, time.perf_counter() - page_start))
+    return pages
+
+class PdfExtractionService:
+    """
+    PDF text extraction under page-count, byte-size and wall-clock limits.
+
+    "inline" extracts on the calling thread; "process" splits the pages across a pool of worker
+    processes so pypdf does not hold the worker's GIL and a stuck document can be abandoned at
+    the deadline. Pages are yielded in order as soon as they are extracted.
+
+    The process pool is billiard's (Celery's own pool library): a prefork worker child is a
+    daemon process, and the stdlib ProcessPoolExecutor refuses to start children from one.
+    """
+
+    def __init__(self,
+                 mode: str = "inline",
+                 max_workers: int = 4,
+                 pages_per_task: int = 4,
+                 max_pages: int = 50,
+                 max_bytes: int = 20 * 1024 * 1024,
+                 timeout: float = 60,
+                 slow_page_seconds: float = 2):
+        if mode not in ("inline", "process"):
+            raise ValueError(f"Unknown PDF extraction mode: {mode}")
+        self.mode = mode
+        self.max_workers = max_workers
+        self.pages_per_task = pages_per_task
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.slow_page_seconds = slow_page_seconds
+        self._pool: Pool | None = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> Pool:
+        with self._pool_lock:
+            if self._pool is None:
+                # forkserver: forking a worker that already runs threads can copy held locks
+                self._pool = Pool(processes=self.max_workers, context=billiard.get_context("forkserver"))
+            return self._pool
+
+    def _discard_pool(self):
+        """Kill the pool after a timeout; pages still running in it cannot be cancelled otherwise."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
+
+    def close(self):
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    def _check_limits(self, pdf_bytes: bytes) -> int:
+        if not pdf_bytes:
+            raise ValueError("PDF bytes cannot be empty")
+        if len(pdf_bytes) > self.max_bytes:
+            raise PdfLimitExceededError(f"PDF is {len(pdf_bytes)} bytes, limit is {self.max_bytes}")
+
+        # Reading the page tree only parses the cross-reference table, not the page contents
+        try:
+            page_count = len(PdfReader(io.BytesIO(pdf_bytes)).pages)
+        except Exception as e:
+            raise Exception(f"Failed to process PDF: {str(e)}")
+
+        if page_count > self.max_pages:
+            raise PdfLimitExceededError(f"PDF has {page_count} pages, limit is {self.max_pages}")
+        return page_count
+
+    def _iter_pages_inline(self, pdf_bytes: bytes, page_count: int, deadline: float) -> Iterator[PdfPageText]:
+        pdf_reader = PdfReader(io.BytesIO(pdf_bytes))
+        for page_index in range(page_count):
+            # A page in progress cannot be interrupted on this thread; the deadline is checked between pages
+            if time.monotonic() > deadline:
+                raise PdfLimitExceededError(f"PDF extraction exceeded {self.timeout}s after {page_index} of {page_count} pages")
+            page_start = time.perf_counter()
+            page_text = pdf_reader.pages[page_index].extract_text() or ""
+            yield PdfPageText(page_number=page_index + 1, text=page_text, seconds=time.perf_counter() - page_start)
+
+    def _iter_pages_process(self, pdf_bytes: bytes, page_count: int, deadline: float) -> Iterator[PdfPageText]:
+        pool = self._get_pool()
+        page_results = [
+            pool.apply_async(_extract_page_range, (pdf_bytes, start, min(start + self.pages_per_task, page_count)))
+            for start in range(0, page_count, self.pages_per_task)
+        ]
+        for page_result in page_results:
+            # Ranges still queued when the consumer stops early are extracted and their results dropped
+            try:
+                page_range = page_result.get(timeout=max(0, deadline - time.monotonic()))
+            except PoolTimeoutError:
+                self._discard_pool()
+                raise PdfLimitExceededError(f"PDF extraction exceeded {self.timeout}s ({page_count} pages)")
+            for page_number, page_text, seconds in page_range:
+                yield PdfPageText(page_number=page_number, text=page_text, seconds=seconds)
+
+    def iter_pages(self, pdf_bytes: bytes) -> Iterator[PdfPageText]:
+        """
+        Text of each page in order, with its extraction time.
+
+        Raises PdfLimitExceededError when the document is too large, has too many pages or
+        takes longer than the timeout.
+        """
+        page_count = self._check_limits(pdf_bytes)
+        deadline = time.monotonic() + self.timeout
+
+        if self.mode == "process":
+            return self._iter_pages_process(pdf_bytes, page_count, deadline)
+        return self._iter_pages_inline(pdf_bytes, page_count, deadline)
+
+    def extract_text(self, pdf_bytes: bytes, clean_text: bool = True) -> str:
+        started = time.perf_counter()
+        content_parts = []
+        page_count = 0
+        slowest_page = None
+
+        for page in self.iter_pages(pdf_bytes):
+            page_count += 1
+            if page.text:
+                content_parts.append(page.text)
+            if slowest_page is None or page.seconds > slowest_page.seconds:
+                slowest_page = page
+            if page.seconds > self.slow_page_seconds:
+                print(f"Slow PDF page {page.page_number}: {page.seconds:.2f}s")
+
+        if slowest_page is not None:
+            print(f"PDF extracted ({self.mode}): {page_count} pages in {time.perf_counter() - started:.2f}s, slowest page {slowest_page.page_number} took {slowest_page.seconds:.2f}s")
+
+        content = "\n".join(content_parts)
+        return normalize_whitespace(content) if clean_text else content
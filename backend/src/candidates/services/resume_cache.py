@@ -0,0 +1,53 @@
+import hashlib
+from typing import BinaryIO
+
+from src.core.blob_store import BlobStore
+
+class ResumeCache:
+    """
+    Resume PDFs by content hash, with an Ashby file handle -> content hash pointer.
+
+    An Ashby file handle always points at the same file, so once its bytes are stored a
+    re-extraction reads them from the blob store instead of going back to Ashby. Identical
+    files are stored once whatever handle they came from.
+    """
+
+    def __init__(self, blob_store: BlobStore):
+        self.blob_store = blob_store
+
+    def _content_key(self, sha256: str) -> str:
+        return f"resumes/sha256/{sha256}.pdf"
+
+    def _handle_key(self, file_handle: str) -> str:
+        # Handles are opaque strings; hashing them keeps the key path-safe
+        return f"resumes/ashby/{hashlib.sha256(file_handle.encode()).hexdigest()}"
+
+    def get_by_hash(self, sha256: str) -> bytes | None:
+        return self.blob_store.get(self._content_key(sha256))
+
+    def get_hash_by_handle(self, file_handle: str) -> str | None:
+        """Content hash of the resume stored for this handle, without reading the file."""
+        sha256 = self.blob_store.get(self._handle_key(file_handle))
+        if sha256 is None or not self.blob_store.exists(self._content_key(sha256.decode())):
+            return None
+        return sha256.decode()
+
+    def get_by_handle(self, file_handle: str) -> bytes | None:
+        sha256 = self.get_hash_by_handle(file_handle)
+        return self.get_by_hash(sha256) if sha256 is not None else None
+
+    def put(self, resume: bytes | BinaryIO, file_handle: str | None = None, sha256: str | None = None) -> str:
+        """
+        Store a resume given as bytes or as a file positioned at its start (sha256 is then required).
+        """
+        if sha256 is None:
+            if not isinstance(resume, bytes):
+                raise ValueError("sha256 is required when the resume is a file")
+            sha256 = hashlib.sha256(resume).hexdigest()
+
+        if not self.blob_store.exists(self._content_key(sha256)):
+            self.blob_store.put(self._content_key(sha256), resume, "application/pdf")
+        if file_handle is not None:
+            self.blob_store.put(self._handle_key(file_handle), sha256.encode(), "text/plain")
+
+        return sha256
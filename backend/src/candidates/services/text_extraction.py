@@ -0,0 +1,57 @@
+import hashlib
+
+from src.core.blob_store import BlobStore
+from ..schemas import Resume, CallTranscript, FileExtension
+from .pdf_extraction import PdfExtractionService
+
+# Bump when extraction output changes so cached text is not reused
+EXTRACTION_VERSION = "v1"
+
+class TextExtractionService:
+    """
+    Text of candidate documents, extracted once per pipeline run and cached by content hash.
+
+    The same bytes always give the same text, so a resume or transcript PDF that was
+    seen before (re-upload, reprocessing) is never parsed again.
+    """
+
+    def __init__(self, pdf_extraction_service: PdfExtractionService, blob_store: BlobStore | None = None):
+        self.pdf_extraction_service = pdf_extraction_service
+        self.blob_store = blob_store
+
+    def _extract(self, kind: str, file_bytes: bytes, clean_text: bool) -> str:
+        if self.blob_store is None:
+            return self.pdf_extraction_service.extract_text(file_bytes, clean_text)
+
+        key = f"text/{EXTRACTION_VERSION}/{kind}/{hashlib.sha256(file_bytes).hexdigest()}.txt"
+
+        # The cache is an optimization; a store error falls back to parsing the PDF
+        try:
+            cached_text = self.blob_store.get(key)
+        except Exception as e:
+            print(f"Extracted text cache read failed for {key}: {e}")
+            cached_text = None
+        if cached_text is not None:
+            return cached_text.decode()
+
+        text = self.pdf_extraction_service.extract_text(file_bytes, clean_text)
+        try:
+            self.blob_store.put(key, text.encode(), "text/plain; charset=utf-8")
+        except Exception as e:
+            print(f"Extracted text cache write failed for {key}: {e}")
+        return text
+
+    def extract_resume(self, resume: Resume) -> str:
+        if resume.extension == FileExtension.PDF:
+            return self._extract("resume", resume.file_bytes, clean_text=True)
+
+        raise ValueError(f"Unsupported resume extension: {resume.extension}")
+
+    def extract_call_transcript(self, call_transcript: CallTranscript) -> str:
+        if call_transcript.extension == FileExtension.PDF:
+            # Fathom transcripts keep their line breaks (speaker turns)
+            return self._extract("call_transcript", call_transcript.file_bytes, clean_text=False)
+        elif call_transcript.extension == FileExtension.STR:
+            return call_transcript.content
+
+        raise ValueError(f"Unsupported call transcript extension: {call_transcript.extension}")
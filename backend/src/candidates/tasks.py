@@ -1,231 +1,409 @@
+from concurrent.futures import ThreadPoolExecutor
+from celery import Task, chain
+from celery.signals import worker_process_shutdown, worker_shutdown
 from src.workers.celery import celery_app
 from .schemas import Resume, CallTranscript, FileExtension, ProcessingStatusEnum
 from src.core.database import supabase
 from src.core.openai import openai_client
-from src.config import APOLLO_API_KEY
+from src.core.cache import redis_client
+from src.core.blob_store import blob_store
+from src.core.idempotency import task_deduplicator
+from src.config import (
+    APOLLO_API_KEY,
+    APOLLO_MAX_WORKERS,
+    APOLLO_REQUESTS_PER_MINUTE,
+    APOLLO_BURST,
+    APOLLO_SEARCH_TARGET_COUNT,
+    APOLLO_SEARCH_PER_PAGE,
+    APOLLO_SEARCH_MAX_PAGES,
+    APOLLO_ORGANIZATION_CACHE_TTL,
+    APOLLO_PERSON_CACHE_TTL,
+    PDF_EXTRACTION_MODE,
+    PDF_EXTRACTION_MAX_WORKERS,
+    PDF_EXTRACTION_PAGES_PER_TASK,
+    PDF_EXTRACTION_MAX_PAGES,
+    PDF_EXTRACTION_MAX_BYTES,
+    PDF_EXTRACTION_TIMEOUT,
+    PDF_EXTRACTION_SLOW_PAGE_SECONDS,
+    LLM_CACHE_ENABLED,
+    PIPELINE_MAX_RETRIES,
+    PIPELINE_RETRY_BACKOFF,
+    PIPELINE_RETRY_BACKOFF_MAX,
+)
 from .services.blinded_resume import BlindedResumeService
 from .services.candidate_preferences import CandidatePreferencesService
+from .services.text_extraction import TextExtractionService
+from .services.pdf_extraction import PdfExtractionService, PdfLimitExceededError
+from .services.llm_cache import LLMResponseCache
+from .services.document_store import document_store, DocumentNotFoundError
+from .services.checkpoints import StageCheckpoints
 from .services.apollo import CompanySearchStrategy, ApolloService, EnrichedPerson, convert_funding_stage_to_apollo
+from .services.apollo_cache import OrganizationEnrichmentCache, PersonEnrichmentCache, normalize_domain
+from .repository import CandidateSyncRepository, CandidateProjection
+
+llm_cache = LLMResponseCache(blob_store) if LLM_CACHE_ENABLED and blob_store is not None else None
+blinded_resume_service = BlindedResumeService(openai_client, "gpt-5", llm_cache)
+candidate_preferences_service = CandidatePreferencesService(openai_client, "gpt-5", llm_cache)
+pdf_extraction_service = PdfExtractionService(
+    mode=PDF_EXTRACTION_MODE,
+    max_workers=PDF_EXTRACTION_MAX_WORKERS,
+    pages_per_task=PDF_EXTRACTION_PAGES_PER_TASK,
+    max_pages=PDF_EXTRACTION_MAX_PAGES,
+    max_bytes=PDF_EXTRACTION_MAX_BYTES,
+    timeout=PDF_EXTRACTION_TIMEOUT,
+    slow_page_seconds=PDF_EXTRACTION_SLOW_PAGE_SECONDS
+)
+text_extraction_service = TextExtractionService(pdf_extraction_service, blob_store)
+apollo_service = ApolloService(
+    APOLLO_API_KEY,
+    max_workers=APOLLO_MAX_WORKERS,
+    requests_per_minute=APOLLO_REQUESTS_PER_MINUTE,
+    burst=APOLLO_BURST,
+    search_target_count=APOLLO_SEARCH_TARGET_COUNT,
+    search_per_page=APOLLO_SEARCH_PER_PAGE,
+    search_max_pages=APOLLO_SEARCH_MAX_PAGES
+)
+candidate_repository = CandidateSyncRepository(supabase)
+checkpoints = StageCheckpoints(blob_store)
+organization_cache = OrganizationEnrichmentCache(supabase, APOLLO_ORGANIZATION_CACHE_TTL, redis_client)
+person_cache = PersonEnrichmentCache(supabase, APOLLO_PERSON_CACHE_TTL, redis_client)
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def close_pdf_extraction_pool(**kwargs):
+    """Stop the PDF extraction processes with the worker (each prefork child, or a solo/threads worker)."""
+    pdf_extraction_service.close()
+
+class PipelineTask(Task):
+    """
+    A stage of the candidate pipeline. Errors are retried with exponential backoff, and a retry
+    resumes from the checkpoints of the same task id instead of redoing paid steps. The candidate
+    is marked FAILED only once retries are exhausted or the error cannot be retried.
+    """
+
+    autoretry_for = (Exception,)
+    dont_autoretry_for = (PdfLimitExceededError, DocumentNotFoundError)
+    max_retries = PIPELINE_MAX_RETRIES
+    retry_backoff = PIPELINE_RETRY_BACKOFF
+    retry_backoff_max = PIPELINE_RETRY_BACKOFF_MAX
+    retry_jitter = True
+    checkpoint_stages: list[str] = []
+
+    def on_success(self, retval, task_id, args, kwargs):
+        checkpoints.clear(task_id, self.checkpoint_stages)
+
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        candidate_id = args[0] if args else kwargs.get("candidate_id")
+        print(f"ERROR IN {self.name.rsplit('.', 1)[-1].upper()}: {str(exc)}")
+        print(f"ERROR TYPE: {type(exc)}")
+        print(f"TRACEBACK: {einfo.traceback}")
+        supabase.table("candidates").update({
+            "processing_status": ProcessingStatusEnum.FAILED
+        }).eq("id", candidate_id).execute()
+        task_deduplicator.finish(kwargs.get("idempotency_key"), False)
+        checkpoints.clear(task_id, self.checkpoint_stages)
+
+def candidate_pipeline(candidate_id: int, resume: dict, call_transcript: dict, company_search_strategy: CompanySearchStrategy, company_domains: list[str], additional_info: str | None = None, role: str | None = None, use_llm_cache: bool = True):
+    """
+    Extraction (llm queue) followed by the company search (apollo queue), as one Celery chain.
+    Each stage carries an idempotency key derived from the candidate and the pipeline inputs;
+    additional_info and role are read from the candidate row by the task and only feed the key.
+    use_llm_cache=False asks gpt-5 again and replaces the cached answers.
+    """
+    pipeline_inputs = (resume, call_transcript, company_search_strategy, company_domains, additional_info, role, use_llm_cache)
+    return chain(
+        process_candidate.si(candidate_id, resume, call_transcript, company_search_strategy, company_domains,
+                             use_llm_cache=use_llm_cache, idempotency_key=task_deduplicator.key(candidate_id, "process_candidate", *pipeline_inputs)),
+        find_companies_apollo.si(candidate_id, company_search_strategy, company_domains,
+                                 idempotency_key=task_deduplicator.key(candidate_id, "find_companies_apollo", *pipeline_inputs))
+    )
+
+def enqueue_candidate_pipeline(candidate_id: int, resume: dict, call_transcript: dict, company_search_strategy: CompanySearchStrategy, company_domains: list[str], additional_info: str | None = None, role: str | None = None, use_llm_cache: bool = True) -> bool:
+    """
+    Queue the candidate pipeline unless the same inputs are already queued, running or were just processed.
+    """
+    pipeline = candidate_pipeline(candidate_id, resume, call_transcript, company_search_strategy, company_domains, additional_info, role, use_llm_cache)
+    idempotency_key = pipeline.tasks[0].kwargs["idempotency_key"]
+
+    if not task_deduplicator.claim(idempotency_key):
+        print(f"Candidate {candidate_id} pipeline already queued for these inputs, skipping")
+        return False
+
+    try:
+        pipeline.apply_async(countdown=5)
+    except Exception:
+        # Nothing was enqueued; release the key so the same inputs can be resubmitted
+        task_deduplicator.finish(idempotency_key, False)
+        raise
+    return True
 
-blinded_resume_service = BlindedResumeService(openai_client, "gpt-5")
-candidate_preferences_service = CandidatePreferencesService(openai_client, "gpt-5")
-apollo_service = ApolloService(APOLLO_API_KEY)
+def stop_pipeline(task):
+    """Drop the stages chained after this task; they must not run on a stage that did not complete."""
+    task.request.chain = None
 
-@celery_app.task
-def process_candidate(candidate_id: int, resume: Resume, call_transcript: CallTranscript, company_search_strategy: CompanySearchStrategy, company_domains: list[str]):
+@celery_app.task(bind=True, base=PipelineTask, checkpoint_stages=["extraction"])
+def process_candidate(self, candidate_id: int, resume: Resume, call_transcript: CallTranscript, company_search_strategy: CompanySearchStrategy, company_domains: list[str], use_llm_cache: bool = True, idempotency_key: str | None = None):
 
     resume = Resume(**resume)
     call_transcript = CallTranscript(**call_transcript)
 
-    try:
-        supabase.table("candidates").update({
-            "processing_status": ProcessingStatusEnum.EXTRACTING_CANDIDATE_DATA
-        }).eq("id", candidate_id).execute()
+    if not task_deduplicator.start(idempotency_key, self.request.id):
+        print(f"Duplicate process_candidate for candidate {candidate_id}, skipping")
+        stop_pipeline(self)
+        return False
 
-        candidate = supabase.table("candidates").select("*").eq("id", candidate_id).execute()
+    supabase.table("candidates").update({
+        "processing_status": ProcessingStatusEnum.EXTRACTING_CANDIDATE_DATA
+    }).eq("id", candidate_id).execute()
 
-        if len(candidate.data) == 0:
-            return False
-        
-        candidate_data = candidate.data[0]
+    candidate_data = candidate_repository.get(candidate_id, CandidateProjection.EXTRACTION)
 
-        blinded_resume = blinded_resume_service.create_blinded_resume(resume, call_transcript, candidate_data['additional_info'], candidate_data['role'])
+    if candidate_data is None:
+        task_deduplicator.finish(idempotency_key, False)
+        stop_pipeline(self)
+        return False
 
-        candidate_company_preferences = candidate_preferences_service.extract_candidate_preferences(resume, call_transcript, candidate_data['additional_info'])
+    extraction = checkpoints.get(self.request.id, "extraction")
 
-        supabase.table("candidates").update({
-            "extracted_data": blinded_resume,
-            "company_preferences": candidate_company_preferences,
-            "processing_status": ProcessingStatusEnum.CANDIDATE_DATA_EXTRACTED
-        }).eq("id", candidate_id).execute()
+    if extraction is None:
+        # Documents arrive as content hashes (claim check); their bytes are in the blob store
+        if document_store is not None:
+            resume = document_store.check_out_resume(resume)
+            call_transcript = document_store.check_out_call_transcript(call_transcript)
+
+        # Parse each document once; both LLM calls work from the same text
+        resume_content = text_extraction_service.extract_resume(resume)
+        call_transcript_content = text_extraction_service.extract_call_transcript(call_transcript)
+
+        # The two gpt-5 calls are independent; running them side by side costs the slower of the two
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            blinded_resume_future = executor.submit(blinded_resume_service.create_blinded_resume, resume_content, call_transcript_content, candidate_data['additional_info'], candidate_data['role'], use_llm_cache)
+            candidate_company_preferences_future = executor.submit(candidate_preferences_service.extract_candidate_preferences, resume_content, call_transcript_content, candidate_data['additional_info'], use_llm_cache)
+
+            extraction = {
+                "extracted_data": blinded_resume_future.result(),
+                "company_preferences": candidate_company_preferences_future.result()
+            }
+
+        checkpoints.put(self.request.id, "extraction", extraction)
+
+    supabase.table("candidates").update({
+        "extracted_data": extraction["extracted_data"],
+        "company_preferences": extraction["company_preferences"],
+        "processing_status": ProcessingStatusEnum.CANDIDATE_DATA_EXTRACTED
+    }).eq("id", candidate_id).execute()
+
+    task_deduplicator.finish(idempotency_key, True)
+
+    # find_companies_apollo runs next in the chain built by candidate_pipeline
+    return True
 
-        ### APOLLO TASKS SHOULD BE CALLED HERE.
-        find_companies_apollo.delay(candidate_id, company_search_strategy, company_domains)
+def enrich_organization_page(organization_domains: list[str], task_id: str, page_index: int) -> tuple[dict[str, dict], list[dict], Exception | None]:
+    """
+    Enrich one page of search results: (fresh cached companies, newly enriched organizations, enrichment error).
+    """
+    # Organizations enriched within the TTL are reused as they are stored in companies_apollo
+    cached_companies = organization_cache.get_many(organization_domains)
+    domains_to_enrich = list({normalize_domain(domain) for domain in organization_domains if domain} - cached_companies.keys())
 
-        return True
+    if not domains_to_enrich:
+        return cached_companies, [], None
 
+    # Enriched before a failed attempt of this task but not yet upserted into companies_apollo
+    enriched_organizations = checkpoints.get(task_id, f"organization_enrichment_{page_index}")
+    if enriched_organizations is not None:
+        return cached_companies, enriched_organizations, None
+
+    try:
+        enriched_organizations = apollo_service.enrich_organizations(domains_to_enrich)
     except Exception as e:
-        print(f"ERROR IN PROCESS CANDIDATE: {str(e)}")
-        print(f"ERROR TYPE: {type(e)}")
-        import traceback
-        print(f"TRACEBACK: {traceback.format_exc()}")
-        supabase.table("candidates").update({
-            "processing_status": ProcessingStatusEnum.FAILED
-        }).eq("id", candidate_id).execute()
+        print(f"Enrichment failed for {len(domains_to_enrich)} domains: {e}")
+        return cached_companies, [], e
+
+    checkpoints.put(task_id, f"organization_enrichment_{page_index}", enriched_organizations)
+    return cached_companies, enriched_organizations, None
+
+def checkpointed_pages(task_id: str, pages):
+    """
+    Pass search pages through while recording them; the whole search is checkpointed once it completes.
+    """
+    seen_pages = []
+    for page in pages:
+        seen_pages.append(page)
+        yield page
+    checkpoints.put(task_id, "organization_search", seen_pages)
+
+@celery_app.task(bind=True, base=PipelineTask, checkpoint_stages=["organization_search", "companies_selected"] + [f"organization_enrichment_{page_index}" for page_index in range(APOLLO_SEARCH_MAX_PAGES)])
+def find_companies_apollo(self, candidate_id: int, company_search_strategy: CompanySearchStrategy, company_domains: list[str], idempotency_key: str | None = None):
+
+    if not task_deduplicator.start(idempotency_key, self.request.id):
+        print(f"Duplicate find_companies_apollo for candidate {candidate_id}, skipping")
         return False
-    
-@celery_app.task
-def find_companies_apollo(candidate_id: int, company_search_strategy: CompanySearchStrategy, company_domains: list[str]):
 
-    try:
-        supabase.table("candidates").update({
-            "processing_status": ProcessingStatusEnum.SEARCHING_COMPANIES
-        }).eq("id", candidate_id).execute()
+    supabase.table("candidates").update({
+        "processing_status": ProcessingStatusEnum.SEARCHING_COMPANIES
+    }).eq("id", candidate_id).execute()
 
-        candidate = supabase.table("candidates").select("*").eq("id", candidate_id).execute()
+    candidate_data = candidate_repository.get(candidate_id, CandidateProjection.PREFERENCES)
 
-        if not candidate.data:
-            return False
-        
-        candidate_data = candidate.data[0]
-        preferences = candidate_data.get('company_preferences', {})
+    if candidate_data is None:
+        task_deduplicator.finish(idempotency_key, False)
+        return False
+    
+    preferences = candidate_data.get('company_preferences', {})
+
+    organization_pages = checkpoints.get(self.request.id, "organization_search")
 
-        organization_ids_domains_found = apollo_service.search_organizations(
+    if organization_pages is None:
+        organization_pages = checkpointed_pages(self.request.id, apollo_service.search_organization_pages(
             preferences['locations'], 
             preferences['categories'], 
             convert_funding_stage_to_apollo(preferences['funding_stage']),
             company_domains,
             company_search_strategy
-        )
-        
-        # # Get already used apollo_ids from active companies !!! and filter out companies already used
-        # companies_in_campaigns = supabase.table("lemlist_campaign_companies").select("company_id").execute()
-        
-        # used_apollo_ids = set()
-        # if companies_in_campaigns.data:
-        #     company_ids = [selection['company_id'] for selection in companies_in_campaigns.data]
-        #     companies = supabase.table("companies_apollo").select("apollo_id").in_("id", company_ids).execute()
-        #     if companies.data:
-        #         used_apollo_ids = set(company['apollo_id'] for company in companies.data if company['apollo_id'])
-        
-        # # Filter out already used organizations
-        # filtered_organization_ids_domains = []
-        # for organization_id, organization_domain in organization_ids_domains_found:
-        #     if organization_id not in used_apollo_ids:
-        #         filtered_organization_ids_domains.append((organization_id, organization_domain))
-        
-        # Use filtered list for enrichment
-        organization_domains_found = [domain for _, domain in organization_ids_domains_found]
-        enriched_organization_data = apollo_service.enrich_organizations(organization_domains_found)
-
-        if len(enriched_organization_data) > 0:
+        ))
+    
+    # # Get already used apollo_ids from active companies !!! and filter out companies already used
+    # companies_in_campaigns = supabase.table("lemlist_campaign_companies").select("company_id").execute()
+    
+    # used_apollo_ids = set()
+    # if companies_in_campaigns.data:
+    #     company_ids = [selection['company_id'] for selection in companies_in_campaigns.data]
+    #     companies = supabase.table("companies_apollo").select("apollo_id").in_("id", company_ids).execute()
+    #     if companies.data:
+    #         used_apollo_ids = set(company['apollo_id'] for company in companies.data if company['apollo_id'])
+    
+    # # Filter out already used organizations
+    # filtered_organization_ids_domains = []
+    # for organization_id, organization_domain in organization_ids_domains_found:
+    #     if organization_id not in used_apollo_ids:
+    #         filtered_organization_ids_domains.append((organization_id, organization_domain))
+    
+    # Use filtered list for enrichment
+    # Each page is enriched as soon as it arrives while the next page is being fetched
+    with ThreadPoolExecutor(max_workers=APOLLO_SEARCH_MAX_PAGES) as executor:
+        page_futures = [
+            executor.submit(enrich_organization_page, [domain for _, domain in organization_ids_domains_found], self.request.id, page_index)
+            for page_index, organization_ids_domains_found in enumerate(organization_pages)
+        ]
+        page_results = [page_future.result() for page_future in page_futures]
+
+    cached_companies = {domain: company for page_cached_companies, _, _ in page_results for domain, company in page_cached_companies.items()}
+    enriched_organization_data = [organization for _, page_enriched_organizations, _ in page_results for organization in page_enriched_organizations]
+    enrichment_errors = [error for _, _, error in page_results if error is not None]
+
+    if enrichment_errors and not cached_companies and not enriched_organization_data:
+        raise enrichment_errors[0]
+
+    if len(enriched_organization_data) > 0 or len(cached_companies) > 0:
+
+        # Several domains can resolve to the same organization; one row per apollo_id keeps the upsert valid
+        companies_by_apollo_id = {org_data['apollo_id']: org_data for org_data in enriched_organization_data if org_data.get('apollo_id')}
+
+        company_ids = [company['id'] for company in cached_companies.values()]
+
+        if companies_by_apollo_id:
+            # Insert new companies and update existing ones in a single round trip
+            upserted_companies = supabase.table("companies_apollo").upsert(
+                list(companies_by_apollo_id.values()),
+                on_conflict="apollo_id"
+            ).execute()
+            organization_cache.set_many(upserted_companies.data)
+            company_ids.extend(company['id'] for company in upserted_companies.data)
+
+        # A cached domain and a newly enriched one can point at the same company
+        company_ids = list(dict.fromkeys(company_ids))
+
+        # Create candidate_company_selections_apollo records (once; a retry after this point must not insert them again)
+        if company_ids and checkpoints.get(self.request.id, "companies_selected") is None:
+            companies_to_candidate = [{'candidate_id': candidate_id, 'company_id': company_id} for company_id in company_ids]
+            supabase.table('candidate_company_selections_apollo').insert(companies_to_candidate).execute()
+            checkpoints.put(self.request.id, "companies_selected", company_ids)
 
-            company_ids = []
+        supabase.table("candidates").update({
+            "processing_status": ProcessingStatusEnum.COMPANIES_MATCHED
+        }).eq("id", candidate_id).execute()
+    
+    else:
+        supabase.table("candidates").update({
+            "processing_status": ProcessingStatusEnum.NO_COMPANIES_MATCHED
+        }).eq("id", candidate_id).execute()
 
-            for org_data in enriched_organization_data:
-                apollo_id = org_data.get('apollo_id')
-                if not apollo_id:
-                    continue
+    task_deduplicator.finish(idempotency_key, True)
 
-                # Check if company with this apollo_id already exists
-                existing_company = supabase.table("companies_apollo").select("id").eq("apollo_id", apollo_id).execute()
+    return True
 
-                if existing_company.data:
-                    # Update existing company
-                    company_id = existing_company.data[0]['id']
-                    supabase.table("companies_apollo").update(org_data).eq("id", company_id).execute()
-                    company_ids.append(company_id)
-                else:
-                    # Insert new company
-                    new_company = supabase.table("companies_apollo").insert(org_data).execute()
-                    if new_company.data:
-                        company_ids.append(new_company.data[0]['id'])
-            
-            # Create candidate_company_selections_apollo records
-            if company_ids:
-                companies_to_candidate = [{'candidate_id': candidate_id, 'company_id': company_id} for company_id in company_ids]
-                supabase.table('candidate_company_selections_apollo').insert(companies_to_candidate).execute()
+@celery_app.task(bind=True, base=PipelineTask, checkpoint_stages=["people_search", "people_enrichment"])
+def find_decision_makers_apollo(self, candidate_id: int):
+    supabase.table("candidates").update({
+        "processing_status": ProcessingStatusEnum.FINDING_DECISION_MAKERS
+    }).eq("id", candidate_id).execute()
 
-            supabase.table("candidates").update({
-                "processing_status": ProcessingStatusEnum.COMPANIES_MATCHED
-            }).eq("id", candidate_id).execute()
-        
-        else:
-            supabase.table("candidates").update({
-                "processing_status": ProcessingStatusEnum.NO_COMPANIES_MATCHED
-            }).eq("id", candidate_id).execute()
+    candidate_company_selections = supabase.table("candidate_company_selections_apollo").select("*").eq("candidate_id", candidate_id).eq("approved_by_candidate", True).execute()
+    if len(candidate_company_selections.data) == 0:
 
-        return True
+        return False
     
-    except Exception as e:
-        print(f"ERROR IN FIND COMPANIES APOLLO: {str(e)}")
-        print(f"ERROR TYPE: {type(e)}")
-        import traceback
-        print(f"TRACEBACK: {traceback.format_exc()}")
-        supabase.table("candidates").update({
-            "processing_status": ProcessingStatusEnum.FAILED
-        }).eq("id", candidate_id).execute()
+    # Resolve every approved company in one query: apollo_id -> companies_apollo.id
+    selected_company_ids = list({selection['company_id'] for selection in candidate_company_selections.data})
+    companies = supabase.table("companies_apollo").select("id, apollo_id").in_("id", selected_company_ids).execute()
+    if len(companies.data) < len(selected_company_ids):
 
         return False
 
-@celery_app.task
-def find_decision_makers_apollo(candidate_id: int):
-    try:
-        supabase.table("candidates").update({
-            "processing_status": ProcessingStatusEnum.FINDING_DECISION_MAKERS
-        }).eq("id", candidate_id).execute()
+    company_id_by_apollo_id = {company['apollo_id']: company['id'] for company in companies.data}
+    organization_ids = list(company_id_by_apollo_id.keys())
 
-        candidate_company_selections = supabase.table("candidate_company_selections_apollo").select("*").eq("candidate_id", candidate_id).eq("approved_by_candidate", True).execute()
-        if len(candidate_company_selections.data) == 0:
+    people_apollo_ids = checkpoints.get(self.request.id, "people_search")
+    if people_apollo_ids is None:
+        people_apollo_ids = apollo_service.search_people_organizations(organization_ids)
+        checkpoints.put(self.request.id, "people_search", people_apollo_ids)
 
-            return False
-        
-        organization_ids = []
-        for selection in candidate_company_selections.data:
-            company_id = selection['company_id']
-            company = supabase.table("companies_apollo").select("*").eq("id", company_id).execute()
-            if len(company.data) == 0:
+    if len(people_apollo_ids) > 0:
+        # Decision makers enriched for an earlier candidate of the same company are already stored
+        fresh_people_apollo_ids = person_cache.get_fresh_ids(people_apollo_ids)
+        people_apollo_ids_to_enrich = [people_apollo_id for people_apollo_id in people_apollo_ids if people_apollo_id not in fresh_people_apollo_ids]
 
-                return False
-            
-            company_apollo_id = company.data[0]['apollo_id']
-            organization_ids.append(company_apollo_id)
+        enriched_people: list[EnrichedPerson] = checkpoints.get(self.request.id, "people_enrichment")
+        if enriched_people is None:
+            enriched_people = apollo_service.enrich_people(people_apollo_ids_to_enrich)
+            checkpoints.put(self.request.id, "people_enrichment", enriched_people)
 
-        people_apollo_ids = apollo_service.search_people_organizations(organization_ids)
+        if len(enriched_people) > 0 or len(fresh_people_apollo_ids) > 0:
+
+            decision_makers_by_apollo_id = {}
+            decision_makers_without_apollo_id = []
+
+            for enriched_person in enriched_people:
+
+                company_id = company_id_by_apollo_id.get(enriched_person.pop("organization_id"))
+                if company_id is None:
+                    continue
+
+                decision_maker = {
+                    **enriched_person,
+                    "company_id": company_id
+                }
+
+                if decision_maker.get('apollo_id'):
+                    decision_makers_by_apollo_id[decision_maker['apollo_id']] = decision_maker
+                else:
+                    # If no apollo_id, still insert (fallback), Apollo ID always exists
+                    decision_makers_without_apollo_id.append(decision_maker)
+
+            if decision_makers_by_apollo_id:
+                # Insert new decision makers and update existing ones in a single round trip
+                supabase.table("company_decision_makers_apollo").upsert(
+                    person_cache.table_rows(list(decision_makers_by_apollo_id.values())),
+                    on_conflict="apollo_id"
+                ).execute()
+
+            if decision_makers_without_apollo_id:
+                supabase.table("company_decision_makers_apollo").insert(person_cache.table_rows(decision_makers_without_apollo_id)).execute()
+        
+            supabase.table("candidates").update({
+                "processing_status": ProcessingStatusEnum.DECISION_MAKERS_FOUND
+            }).eq("id", candidate_id).execute()
+
+            return True
 
-        if len(people_apollo_ids) > 0:
-            enriched_people: list[EnrichedPerson] = apollo_service.enrich_people(people_apollo_ids)
-
-            if len(enriched_people) > 0:
-
-                for enriched_person in enriched_people:
-
-                    company = supabase.table("companies_apollo").select("id").eq("apollo_id", enriched_person['organization_id']).execute()
-
-                    try:
-                        company_id = company.data[0]['id']
-                    except:
-                        continue
-                    
-                    apollo_id = enriched_person.get('apollo_id')
-                    enriched_person.pop("organization_id")
-
-                    if apollo_id:
-                        # Check if decision maker with this apollo_id already exists
-                        existing_decision_maker = supabase.table("company_decision_makers_apollo").select("id").eq("apollo_id", apollo_id).execute()
-                        
-                        if existing_decision_maker.data:
-                            # Update existing decision maker
-                            decision_maker_id = existing_decision_maker.data[0]['id']
-                            supabase.table("company_decision_makers_apollo").update({
-                                **enriched_person,
-                                "company_id": company_id
-                            }).eq("id", decision_maker_id).execute()
-                        else:
-                            # Insert new decision maker
-                            supabase.table("company_decision_makers_apollo").insert({
-                                **enriched_person,
-                                "company_id": company_id
-                            }).execute()
-                    else:
-                        # If no apollo_id, still insert (fallback), Apollo ID always exists
-                        supabase.table("company_decision_makers_apollo").insert({
-                            **enriched_person,
-                            "company_id": company_id
-                        }).execute()
-            
-                supabase.table("candidates").update({
-                    "processing_status": ProcessingStatusEnum.DECISION_MAKERS_FOUND
-                }).eq("id", candidate_id).execute()
-
-                return True
-    
-    except Exception as e:
-        print(f"ERROR IN FIND DECISION MAKERS APOLLO: {str(e)}")
-        print(f"ERROR TYPE: {type(e)}")
-        import traceback
-        print(f"TRACEBACK: {traceback.format_exc()}")
-        supabase.table("candidates").update({
-            "processing_status": ProcessingStatusEnum.FAILED
-        }).eq("id", candidate_id).execute()
-        return False
@@ -1,22 +1,89 @@
 import os
+import json
+import tempfile
 
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_SECRET_KEY = os.getenv('SUPABASE_SECRET_KEY')
 SUPABASE_JWT_SECRET = os.getenv('SUPABASE_JWT_SECRET')
 
+# Connection pool shared by every request through the app-lifetime Supabase client
+SUPABASE_HTTP_MAX_CONNECTIONS = int(os.getenv('SUPABASE_HTTP_MAX_CONNECTIONS', '50'))
+SUPABASE_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('SUPABASE_HTTP_MAX_KEEPALIVE_CONNECTIONS', '20'))
+SUPABASE_HTTP_KEEPALIVE_EXPIRY = float(os.getenv('SUPABASE_HTTP_KEEPALIVE_EXPIRY', '30'))
+SUPABASE_HTTP_TIMEOUT = float(os.getenv('SUPABASE_HTTP_TIMEOUT', '120'))
+SUPABASE_HTTP2 = os.getenv('SUPABASE_HTTP2', 'true').lower() == 'true'
+
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND')
+# Optional Redis for shared caches (unset disables the Redis layer)
+CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL')
+# Duplicate enqueues of a pipeline stage are dropped while it is queued/running and for this long after it finished
+IDEMPOTENCY_PENDING_TTL = int(os.getenv('IDEMPOTENCY_PENDING_TTL', '3600'))
+IDEMPOTENCY_DONE_TTL = int(os.getenv('IDEMPOTENCY_DONE_TTL', '600'))
+# Failed pipeline stages are retried with exponential backoff (seconds), resuming from their checkpoints
+PIPELINE_MAX_RETRIES = int(os.getenv('PIPELINE_MAX_RETRIES', '3'))
+PIPELINE_RETRY_BACKOFF = int(os.getenv('PIPELINE_RETRY_BACKOFF', '10'))
+PIPELINE_RETRY_BACKOFF_MAX = int(os.getenv('PIPELINE_RETRY_BACKOFF_MAX', '600'))
 
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
+# Reuse parsed gpt responses for identical model, prompt, input and schema (kept in the blob store)
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+
+# PDF text extraction: "inline" (calling thread) or "process" (pages split across a billiard process pool).
+# "process" works on prefork, threads and solo workers; each prefork child starts its own pool,
+# so a worker runs up to concurrency x PDF_EXTRACTION_MAX_WORKERS extraction processes.
+PDF_EXTRACTION_MODE = os.getenv('PDF_EXTRACTION_MODE', 'inline').lower()
+PDF_EXTRACTION_MAX_WORKERS = int(os.getenv('PDF_EXTRACTION_MAX_WORKERS', '4'))
+PDF_EXTRACTION_PAGES_PER_TASK = int(os.getenv('PDF_EXTRACTION_PAGES_PER_TASK', '4'))
+PDF_EXTRACTION_MAX_PAGES = int(os.getenv('PDF_EXTRACTION_MAX_PAGES', '50'))
+PDF_EXTRACTION_MAX_BYTES = int(os.getenv('PDF_EXTRACTION_MAX_BYTES', str(20 * 1024 * 1024)))
+PDF_EXTRACTION_TIMEOUT = float(os.getenv('PDF_EXTRACTION_TIMEOUT', '60'))
+# Pages slower than this are logged individually
+PDF_EXTRACTION_SLOW_PAGE_SECONDS = float(os.getenv('PDF_EXTRACTION_SLOW_PAGE_SECONDS', '2'))
+
+# Blob store for cached documents: "local" (directory below), "supabase" (Storage bucket below) or "none"
+BLOB_STORE_BACKEND = os.getenv('BLOB_STORE_BACKEND', 'local').lower()
+BLOB_STORE_LOCAL_DIR = os.getenv('BLOB_STORE_LOCAL_DIR', os.path.join(tempfile.gettempdir(), 'candidate-mpc-blobs'))
+BLOB_STORE_SUPABASE_BUCKET = os.getenv('BLOB_STORE_SUPABASE_BUCKET', 'blobs')
 
 APOLLO_API_KEY = os.getenv('APOLLO_API_KEY')
+APOLLO_MAX_WORKERS = int(os.getenv('APOLLO_MAX_WORKERS', '8'))
+# Per API key across all workers when CACHE_REDIS_URL is set, per worker process otherwise
+APOLLO_REQUESTS_PER_MINUTE = float(os.getenv('APOLLO_REQUESTS_PER_MINUTE', '200'))
+APOLLO_BURST = int(os.getenv('APOLLO_BURST', '20'))
+# Company search pages until this many domains were found or the page cap is reached (per_page max 100)
+APOLLO_SEARCH_TARGET_COUNT = int(os.getenv('APOLLO_SEARCH_TARGET_COUNT', '20'))
+APOLLO_SEARCH_PER_PAGE = int(os.getenv('APOLLO_SEARCH_PER_PAGE', '20'))
+APOLLO_SEARCH_MAX_PAGES = int(os.getenv('APOLLO_SEARCH_MAX_PAGES', '5'))
+# Enriched organizations younger than this are reused instead of calling Apollo again
+APOLLO_ORGANIZATION_CACHE_TTL = int(os.getenv('APOLLO_ORGANIZATION_CACHE_TTL', str(7 * 24 * 3600)))
+APOLLO_PERSON_CACHE_TTL = int(os.getenv('APOLLO_PERSON_CACHE_TTL', str(30 * 24 * 3600)))
 
 ASHBY_API_KEY = os.getenv('ASHBY_API_KEY')
+ASHBY_HTTP_MAX_CONNECTIONS = int(os.getenv('ASHBY_HTTP_MAX_CONNECTIONS', '10'))
+ASHBY_HTTP_TIMEOUT = float(os.getenv('ASHBY_HTTP_TIMEOUT', '30'))
+ASHBY_RESUME_MAX_BYTES = int(os.getenv('ASHBY_RESUME_MAX_BYTES', str(20 * 1024 * 1024)))
 FATHOM_API_KEY = os.getenv('FATHOM_API_KEY')
+# Seconds a synced invitee index is trusted before new meetings are fetched again
+FATHOM_INDEX_SYNC_INTERVAL = int(os.getenv('FATHOM_INDEX_SYNC_INTERVAL', '60'))
+# Transcripts never change once recorded; the TTL only bounds Redis memory (0 keeps them)
+FATHOM_TRANSCRIPT_CACHE_TTL = int(os.getenv('FATHOM_TRANSCRIPT_CACHE_TTL', str(30 * 24 * 3600))) or None
+FATHOM_TRANSCRIPT_CACHE_MAX_LOCAL_BYTES = int(os.getenv('FATHOM_TRANSCRIPT_CACHE_MAX_LOCAL_BYTES', str(64 * 1024 * 1024)))
 
 EMAIL_HOSTNAME = os.getenv('EMAIL_HOSTNAME')
 EMAIL_PORT = os.getenv('EMAIL_PORT')
 EMAIL_USERNAME = os.getenv('EMAIL_USERNAME')
 EMAIL_PASSWORD = os.getenv('EMAIL_PASSWORD')
 
-LEMLIST_API_KEY = os.getenv('LEMLIST_API_KEY')
\ No newline at end of file
+LEMLIST_API_KEY = os.getenv('LEMLIST_API_KEY')
+LEMLIST_HTTP_MAX_CONNECTIONS = int(os.getenv('LEMLIST_HTTP_MAX_CONNECTIONS', '20'))
+LEMLIST_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('LEMLIST_HTTP_MAX_KEEPALIVE_CONNECTIONS', '10'))
+LEMLIST_HTTP_KEEPALIVE_EXPIRY = float(os.getenv('LEMLIST_HTTP_KEEPALIVE_EXPIRY', '30'))
+LEMLIST_HTTP_TIMEOUT = float(os.getenv('LEMLIST_HTTP_TIMEOUT', '30'))
+LEMLIST_HTTP2 = os.getenv('LEMLIST_HTTP2', 'true').lower() == 'true'
+# Celery-side Lemlist client (requests); per-endpoint read timeouts as JSON, e.g. {"get_campaign_leads": 60}
+LEMLIST_SYNC_TIMEOUT = float(os.getenv('LEMLIST_SYNC_TIMEOUT', '30'))
+LEMLIST_SYNC_ENDPOINT_TIMEOUTS = json.loads(os.getenv('LEMLIST_SYNC_ENDPOINT_TIMEOUTS', '{}'))
+LEMLIST_SYNC_MAX_RETRIES = int(os.getenv('LEMLIST_SYNC_MAX_RETRIES', '5'))
+LEMLIST_SYNC_BACKOFF_BASE = float(os.getenv('LEMLIST_SYNC_BACKOFF_BASE', '0.5'))
+LEMLIST_SYNC_BACKOFF_MAX = float(os.getenv('LEMLIST_SYNC_BACKOFF_MAX', '30'))
\ No newline at end of file
@@ -0,0 +1,107 @@
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+import shutil
+from typing import BinaryIO
+from storage3.utils import StorageException
+
+from src.config import BLOB_STORE_BACKEND, BLOB_STORE_LOCAL_DIR, BLOB_STORE_SUPABASE_BUCKET
+
+class BlobStore(ABC):
+    """
+    Immutable byte blobs by key. Synchronous, so the same store works in Celery tasks and,
+    through asyncio.to_thread, in the API.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        ...
+
+    @abstractmethod
+    def put(self, key: str, data: bytes | BinaryIO, content_type: str = "application/octet-stream"):
+        """data is bytes or a binary file read from its current position (e.g. a download spool)."""
+
+    def exists(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    @abstractmethod
+    def delete(self, key: str):
+        ...
+
+class LocalBlobStore(BlobStore):
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError(f"Invalid blob key: {key}")
+        return path
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes | BinaryIO, content_type: str = "application/octet-stream"):
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so readers never see a partial blob
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+            if isinstance(data, bytes):
+                tmp.write(data)
+            else:
+                shutil.copyfileobj(data, tmp)
+        os.replace(tmp.name, path)
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def delete(self, key: str):
+        self._path(key).unlink(missing_ok=True)
+
+class SupabaseBlobStore(BlobStore):
+    def __init__(self, supabase_client, bucket: str):
+        # Must be a client with its own httpx client; storage3 rebinds base_url on the client it is given
+        self.bucket = supabase_client.storage.from_(bucket)
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return self.bucket.download(key)
+        except StorageException as e:
+            if "not found" in str(e).lower() or "404" in str(e):
+                return None
+            raise
+
+    def put(self, key: str, data: bytes | BinaryIO, content_type: str = "application/octet-stream"):
+        file_options = {"content-type": content_type, "upsert": "true"}
+        if isinstance(data, bytes):
+            self.bucket.upload(key, data, file_options)
+            return
+
+        # storage3 streams only real file readers; read the object's file descriptor from where it stands
+        data.flush()
+        with open(os.dup(data.fileno()), "rb") as reader:
+            reader.seek(data.tell())
+            self.bucket.upload(key, reader, file_options)
+
+    def exists(self, key: str) -> bool:
+        return self.bucket.exists(key)
+
+    def delete(self, key: str):
+        self.bucket.remove([key])
+
+def create_blob_store() -> BlobStore | None:
+    """
+    Store selected by BLOB_STORE_BACKEND: "local" (default), "supabase" or "none".
+    """
+    if BLOB_STORE_BACKEND == "supabase":
+        from src.core.database import supabase
+        return SupabaseBlobStore(supabase, BLOB_STORE_SUPABASE_BUCKET)
+    if BLOB_STORE_BACKEND == "local":
+        return LocalBlobStore(BLOB_STORE_LOCAL_DIR)
+    return None
+
+blob_store = create_blob_store()
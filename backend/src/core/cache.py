@@ -0,0 +1,10 @@
+import redis
+import redis.asyncio
+from src.config import CACHE_REDIS_URL
+
+# Optional shared cache layer; None when CACHE_REDIS_URL is not configured.
+# redis-py reconnects after fork, so the module-level client is safe in Celery workers.
+redis_client = redis.Redis.from_url(CACHE_REDIS_URL) if CACHE_REDIS_URL else None
+
+# Same cache for async code in the API process (closed in the app lifespan)
+async_redis_client = redis.asyncio.Redis.from_url(CACHE_REDIS_URL) if CACHE_REDIS_URL else None
@@ -1,16 +1,51 @@
-from supabase import create_client, acreate_client, AsyncClient, Client
+import httpx
+from fastapi import Request
+from supabase import create_client, acreate_client, AsyncClient, Client, AsyncClientOptions
 
-from src.config import SUPABASE_URL, SUPABASE_SECRET_KEY, SUPABASE_JWT_SECRET
+from src.core.http import http2_available
+from src.config import (
+    SUPABASE_URL,
+    SUPABASE_SECRET_KEY,
+    SUPABASE_JWT_SECRET,
+    SUPABASE_HTTP_MAX_CONNECTIONS,
+    SUPABASE_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    SUPABASE_HTTP_KEEPALIVE_EXPIRY,
+    SUPABASE_HTTP_TIMEOUT,
+    SUPABASE_HTTP2,
+)
 
 if not all([SUPABASE_URL, SUPABASE_SECRET_KEY, SUPABASE_JWT_SECRET]):
     raise EnvironmentError("One or more Supabase environment variables are missing.")
 
+def create_supabase_http_client() -> httpx.AsyncClient:
+    """
+    Build the keep-alive connection pool used by the app-lifetime Supabase client.
+
+    The same httpx client is handed to PostgREST and Auth, so every request reuses
+    warm connections (and a single HTTP/2 connection when h2 is installed) instead
+    of paying for a new TCP + TLS handshake.
+    """
+    return httpx.AsyncClient(
+        http2=SUPABASE_HTTP2 and http2_available(),
+        limits=httpx.Limits(
+            max_connections=SUPABASE_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=SUPABASE_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=SUPABASE_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(SUPABASE_HTTP_TIMEOUT),
+        follow_redirects=True,
+    )
+
 # SUPABASE ADMIN CLIENT
-async def create_supabase():
-  supabase: AsyncClient = await acreate_client(SUPABASE_URL, SUPABASE_SECRET_KEY)
+async def create_supabase(http_client: httpx.AsyncClient | None = None):
+  # Note: storage3 rebinds base_url on the httpx client it is given, so Supabase Storage
+  # must not be used through a client created with a shared http_client.
+  options = AsyncClientOptions(httpx_client=http_client) if http_client is not None else None
+  supabase: AsyncClient = await acreate_client(SUPABASE_URL, SUPABASE_SECRET_KEY, options=options)
   return supabase
 
-async def get_supabase_admin_client():
-    return await create_supabase()
+async def get_supabase_admin_client(request: Request) -> AsyncClient:
+    # Created once in the FastAPI lifespan (see src/main.py)
+    return request.app.state.supabase
 
 supabase: Client = create_client(SUPABASE_URL, SUPABASE_SECRET_KEY)
@@ -0,0 +1,50 @@
+import httpx
+
+def http2_available() -> bool:
+    """
+    httpx only negotiates HTTP/2 when the optional h2 package is installed.
+    """
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+class PooledAsyncClient:
+    """
+    One httpx.AsyncClient (connection pool) shared by every call of a service.
+
+    open/aclose are called from the FastAPI lifespan; outside it (scripts, benchmarks) the
+    pool is opened on first use.
+    """
+
+    def __init__(self,
+                 max_connections: int,
+                 max_keepalive_connections: int,
+                 keepalive_expiry: float,
+                 timeout: float,
+                 http2: bool = True):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout)
+        self.http2 = http2 and http2_available()
+        self._client: httpx.AsyncClient | None = None
+
+    async def open(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(limits=self.limits, timeout=self.timeout, http2=self.http2)
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Outside the lifespan the pool is opened on first use
+        if self._client is None:
+            self._client = httpx.AsyncClient(limits=self.limits, timeout=self.timeout, http2=self.http2)
+        return self._client
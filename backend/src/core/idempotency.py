@@ -0,0 +1,77 @@
+import hashlib
+import json
+import redis
+from redis import Redis
+
+from src.config import IDEMPOTENCY_PENDING_TTL, IDEMPOTENCY_DONE_TTL
+from src.core.cache import redis_client
+
+# Claim a key for a run unless another task holds it or it already finished
+START_SCRIPT = """
+local state = redis.call('GET', KEYS[1])
+if state == false or state == 'queued' or state == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+    return 1
+end
+return 0
+"""
+
+class TaskDeduplicator:
+    """
+    Redis-backed idempotency keys for pipeline tasks.
+
+    A key (candidate id, stage, input hash) goes queued -> running:<task id> -> done. A second
+    enqueue of the same key is dropped while it is queued, running or recently done, and a
+    redelivered message for a key another task is running is skipped. Celery retries keep their
+    task id and may run again. A failed run releases the key so it can be resubmitted.
+
+    Without Redis (or when Redis is unreachable) nothing is deduplicated.
+    """
+
+    def __init__(self, redis_client: Redis | None, pending_ttl: int, done_ttl: int):
+        self.redis = redis_client
+        self.pending_ttl = pending_ttl
+        self.done_ttl = done_ttl
+        self._start_script = redis_client.register_script(START_SCRIPT) if redis_client is not None else None
+
+    def key(self, candidate_id: int, stage: str, *inputs) -> str:
+        input_hash = hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+        return f"idempotency:{stage}:{candidate_id}:{input_hash}"
+
+    def claim(self, key: str) -> bool:
+        """
+        Reserve a key before enqueueing. False means the same work is already queued, running or just finished.
+        """
+        if self.redis is None:
+            return True
+        try:
+            return bool(self.redis.set(key, "queued", nx=True, ex=self.pending_ttl))
+        except redis.RedisError as e:
+            print(f"Idempotency claim failed for {key}: {e}")
+            return True
+
+    def start(self, key: str | None, task_id: str) -> bool:
+        """
+        Mark a key as running in this task. False means another task runs it or it is done.
+        Tasks enqueued without a key (None) always run.
+        """
+        if self.redis is None or key is None:
+            return True
+        try:
+            return bool(self._start_script(keys=[key], args=[f"running:{task_id}", self.pending_ttl]))
+        except redis.RedisError as e:
+            print(f"Idempotency start failed for {key}: {e}")
+            return True
+
+    def finish(self, key: str | None, succeeded: bool):
+        if self.redis is None or key is None:
+            return
+        try:
+            if succeeded:
+                self.redis.set(key, "done", ex=self.done_ttl)
+            else:
+                self.redis.delete(key)
+        except redis.RedisError as e:
+            print(f"Idempotency finish failed for {key}: {e}")
+
+task_deduplicator = TaskDeduplicator(redis_client, IDEMPOTENCY_PENDING_TTL, IDEMPOTENCY_DONE_TTL)
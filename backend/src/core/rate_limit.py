@@ -0,0 +1,97 @@
+import hashlib
+import threading
+import time
+import redis
+from redis import Redis
+
+from src.core.cache import redis_client as shared_redis_client
+
+# Refill the bucket by the time elapsed on the Redis clock and reserve one token.
+# Returns the seconds to wait for the reserved slot (as a string, Lua numbers are truncated to integers).
+ACQUIRE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(state[1]) or burst
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + (now - updated_at) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 60)
+if tokens < 0 then
+    return tostring(-tokens / rate)
+end
+return '0'
+"""
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: up to `burst` calls at once, refilled at `rate_per_minute`.
+
+    Callers past the budget reserve the next free slot and sleep outside the lock, so
+    waiting threads are released in order without busy-waiting.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int):
+        self.rate = rate_per_minute / 60
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if wait > 0:
+            time.sleep(wait)
+
+class RedisRateLimiter:
+    """
+    The same token bucket kept in Redis, so every worker process and host using the key
+    draws from one budget (a prefork worker with concurrency 8 would otherwise get 8 buckets).
+
+    If Redis is unreachable the call goes through the process-local bucket instead.
+    """
+
+    def __init__(self, redis_client: Redis, key: str, rate_per_minute: float, burst: int):
+        self.redis = redis_client
+        self.key = key
+        self.rate = rate_per_minute / 60
+        self.burst = burst
+        self._acquire_script = redis_client.register_script(ACQUIRE_SCRIPT)
+        self._fallback = RateLimiter(rate_per_minute, burst)
+
+    def acquire(self):
+        try:
+            wait = float(self._acquire_script(keys=[self.key], args=[self.rate, self.burst]))
+        except redis.RedisError as e:
+            print(f"Rate limiter Redis call failed for {self.key}, limiting in process: {e}")
+            self._fallback.acquire()
+            return
+
+        if wait > 0:
+            time.sleep(wait)
+
+_rate_limiters: dict[str, RateLimiter | RedisRateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+def get_rate_limiter(key: str, rate_per_minute: float, burst: int, redis_client: Redis | None = shared_redis_client) -> RateLimiter | RedisRateLimiter:
+    """
+    Limiter per key (e.g. per API key), shared by every service instance using it. With Redis
+    the budget is shared across processes; without it each process has the full budget.
+    """
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            if redis_client is not None:
+                # The key may hold a secret; only its hash is stored in Redis
+                redis_key = f"rate_limit:{hashlib.sha256(key.encode()).hexdigest()}"
+                _rate_limiters[key] = RedisRateLimiter(redis_client, redis_key, rate_per_minute, burst)
+            else:
+                _rate_limiters[key] = RateLimiter(rate_per_minute, burst)
+        return _rate_limiters[key]
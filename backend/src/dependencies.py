@@ -51,9 +51,16 @@ AdminOrCandidate = Annotated[dict, Depends(check_roles(["admin", "candidate"]))]
 
 from src.core.database import get_supabase_admin_client, AsyncClient
 from src.services.candidate_lifecycle_service import CandidateLifecycleService
+from src.candidates.repository import CandidateRepository
 
 # Service Dependencies
 async def get_candidate_lifecycle_service(
     supabase_client: AsyncClient = Depends(get_supabase_admin_client)
 ) -> CandidateLifecycleService:
     return CandidateLifecycleService(supabase_client)
+
+
+async def get_candidate_repository(
+    supabase_client: AsyncClient = Depends(get_supabase_admin_client)
+) -> CandidateRepository:
+    return CandidateRepository(supabase_client)
@@ -0,0 +1,145 @@
+import asyncio
+import json
+import time
+from datetime import datetime
+from fathom_python import Fathom
+from redis.asyncio import Redis
+
+class FathomMeetingIndex:
+    """
+    Invitee email -> meetings index of the Fathom account, synced incrementally.
+
+    Each sync only lists meetings created after the newest meeting already indexed, so a
+    lookup is a key read plus, at most every sync_interval seconds, one small list call
+    instead of a scan over the whole meeting history.
+
+    Kept in Redis when configured (shared by every API process), in memory otherwise.
+    """
+
+    SYNCED_THROUGH_KEY = "fathom:index:synced_through"
+    FRESH_KEY = "fathom:index:fresh"
+    SYNC_LOCK_KEY = "fathom:index:sync_lock"
+    MEETINGS_KEY = "fathom:index:meetings"
+
+    def __init__(self, redis_client: Redis | None = None, sync_interval: int = 60):
+        self.redis = redis_client
+        self.sync_interval = sync_interval
+        self._lock = asyncio.Lock()
+        # In-memory fallback
+        self._meetings_by_email: dict[str, dict[int, dict]] = {}
+        self._synced_through: str | None = None
+        self._synced_at: float | None = None
+
+    def _invitee_key(self, email: str) -> str:
+        return f"fathom:index:invitee:{email}"
+
+    async def latest_meeting(self, fathom: Fathom, email: str) -> dict | None:
+        """
+        Most recently scheduled meeting with this invitee: {recording_id, title, scheduled_start_time}.
+
+        A miss forces a sync first, since the call may have been recorded moments ago.
+        """
+        email = email.strip().lower()
+
+        if not await self._is_fresh():
+            await self.sync(fathom)
+
+        meeting = await self._get_latest(email)
+        if meeting is None:
+            await self.sync(fathom)
+            meeting = await self._get_latest(email)
+
+        return meeting
+
+    async def sync(self, fathom: Fathom):
+        async with self._lock:
+            if self.redis is not None:
+                # One process syncs at a time; the others wait and then find little left to fetch
+                async with self.redis.lock(self.SYNC_LOCK_KEY, timeout=600, blocking_timeout=600):
+                    await self._sync(fathom)
+            else:
+                await self._sync(fathom)
+
+    async def _sync(self, fathom: Fathom):
+        synced_through = await self._get_synced_through()
+        newest_created_at = datetime.fromisoformat(synced_through) if synced_through else None
+        indexed = 0
+
+        cursor = None
+        while True:
+            res = await fathom.list_meetings_async(created_after=synced_through, cursor=cursor)
+            if res is None:
+                break
+
+            entries = []
+            for meeting in res.result.items:
+                summary = {
+                    "recording_id": meeting.recording_id,
+                    "title": meeting.title,
+                    "scheduled_start_time": meeting.scheduled_start_time.isoformat(),
+                }
+                for invitee in meeting.calendar_invitees:
+                    if invitee.email:
+                        entries.append((invitee.email.strip().lower(), meeting.scheduled_start_time.timestamp(), summary))
+
+                if newest_created_at is None or meeting.created_at > newest_created_at:
+                    newest_created_at = meeting.created_at
+
+            await self._store(entries)
+            indexed += len(res.result.items)
+
+            cursor = res.result.next_cursor
+            if not cursor:
+                break
+
+        await self._mark_synced(newest_created_at.isoformat() if newest_created_at else None)
+        print(f"Fathom index synced {indexed} meetings created after {synced_through}")
+
+    async def _get_synced_through(self) -> str | None:
+        if self.redis is not None:
+            synced_through = await self.redis.get(self.SYNCED_THROUGH_KEY)
+            return synced_through.decode() if synced_through else None
+        return self._synced_through
+
+    async def _is_fresh(self) -> bool:
+        if self.redis is not None:
+            return bool(await self.redis.exists(self.FRESH_KEY))
+        return self._synced_at is not None and time.monotonic() - self._synced_at < self.sync_interval
+
+    async def _mark_synced(self, synced_through: str | None):
+        if self.redis is not None:
+            pipeline = self.redis.pipeline(transaction=False)
+            if synced_through:
+                pipeline.set(self.SYNCED_THROUGH_KEY, synced_through)
+            pipeline.set(self.FRESH_KEY, 1, ex=self.sync_interval)
+            await pipeline.execute()
+        else:
+            self._synced_through = synced_through or self._synced_through
+            self._synced_at = time.monotonic()
+
+    async def _store(self, entries: list[tuple[str, float, dict]]):
+        if not entries:
+            return
+
+        if self.redis is not None:
+            pipeline = self.redis.pipeline(transaction=False)
+            for email, score, summary in entries:
+                pipeline.zadd(self._invitee_key(email), {summary["recording_id"]: score})
+                pipeline.hset(self.MEETINGS_KEY, summary["recording_id"], json.dumps(summary))
+            await pipeline.execute()
+        else:
+            for email, _, summary in entries:
+                self._meetings_by_email.setdefault(email, {})[summary["recording_id"]] = summary
+
+    async def _get_latest(self, email: str) -> dict | None:
+        if self.redis is not None:
+            recording_ids = await self.redis.zrevrange(self._invitee_key(email), 0, 0)
+            if not recording_ids:
+                return None
+            summary = await self.redis.hget(self.MEETINGS_KEY, recording_ids[0])
+            return json.loads(summary) if summary else None
+
+        meetings = self._meetings_by_email.get(email)
+        if not meetings:
+            return None
+        return max(meetings.values(), key=lambda meeting: datetime.fromisoformat(meeting["scheduled_start_time"]))
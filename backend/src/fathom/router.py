@@ -1,9 +1,14 @@
 from fastapi import APIRouter, HTTPException
 from fathom_python import Fathom, models
-from src.config import FATHOM_API_KEY
+from src.config import FATHOM_API_KEY, FATHOM_INDEX_SYNC_INTERVAL
+from src.core.cache import async_redis_client
+from .index import FathomMeetingIndex
+from .transcripts import transcript_cache
 
 router = APIRouter(tags=["Fathom"])
 
+meeting_index = FathomMeetingIndex(async_redis_client, sync_interval=FATHOM_INDEX_SYNC_INTERVAL)
+
 async def get_meeting_transcript_by_email(
     email_to_search: str
 ):
@@ -13,40 +18,26 @@ async def get_meeting_transcript_by_email(
         ),
     ) as fathom:
 
-        res = await fathom.list_meetings_async()
-        found_meeting = None
-            
-        while res is not None:
-            meetings = res.result.items
-            for meeting in meetings:
-                for invitee in meeting.calendar_invitees:
-                    if invitee.email == email_to_search:
-                        found_meeting = meeting
-                        break
-                if found_meeting is not None:
-                    break
-            if found_meeting is not None:
-                break
-            res = res.next()
+        found_meeting = await meeting_index.latest_meeting(fathom, email_to_search)
 
         if found_meeting is None:
             return None
         
-        transcript = await fathom.get_recording_transcript_async(recording_id=found_meeting.recording_id, destination_url="")
-
-        transcript_text = ""
-
-        for item in transcript.transcript:
-            transcript_text += f"{item.speaker.display_name}: {item.text}"
+        transcript_text = await transcript_cache.get_transcript(fathom, found_meeting["recording_id"])
 
-        return transcript_text, found_meeting.recording_id, found_meeting.title
+        return transcript_text, found_meeting["recording_id"], found_meeting["title"]
 
 
 @router.get("/fathom/transcript")
 async def get_transcript(
     email: str
 ):
-    transcript_text, recording_id, call_transcript_title = await get_meeting_transcript_by_email(email)
+    meeting_transcript = await get_meeting_transcript_by_email(email)
+
+    if meeting_transcript is None:
+        raise HTTPException(status_code=404, detail="No Fathom meeting found for this email")
+
+    transcript_text, recording_id, call_transcript_title = meeting_transcript
 
     return {
         "transcript": transcript_text,
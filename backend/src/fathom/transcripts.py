@@ -0,0 +1,79 @@
+import zlib
+from collections import OrderedDict
+from fathom_python import Fathom
+from redis.asyncio import Redis
+import redis
+
+from src.config import FATHOM_TRANSCRIPT_CACHE_TTL, FATHOM_TRANSCRIPT_CACHE_MAX_LOCAL_BYTES
+from src.core.cache import async_redis_client
+
+def format_transcript(transcript) -> str:
+    """
+    "speaker: text" per turn, assembled in one pass.
+    """
+    return "".join(f"{item.speaker.display_name}: {item.text}" for item in transcript.transcript)
+
+class TranscriptCache:
+    """
+    Formatted Fathom transcripts by recording_id, zlib-compressed.
+
+    A recording's transcript does not change, so candidate updates and reprocessing reuse
+    the stored text instead of downloading it again. Kept in Redis when configured,
+    otherwise in a per-process LRU capped at max_local_bytes of compressed text.
+    """
+
+    def __init__(self, redis_client: Redis | None = None, ttl: int | None = None, max_local_bytes: int = 64 * 1024 * 1024):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.max_local_bytes = max_local_bytes
+        self._local: OrderedDict[int, bytes] = OrderedDict()
+        self._local_bytes = 0
+
+    def _key(self, recording_id: int) -> str:
+        return f"fathom:transcript:{recording_id}"
+
+    async def get(self, recording_id: int) -> str | None:
+        compressed = None
+        if self.redis is not None:
+            try:
+                compressed = await self.redis.get(self._key(recording_id))
+            except redis.RedisError as e:
+                print(f"Transcript cache Redis read failed: {e}")
+        elif recording_id in self._local:
+            self._local.move_to_end(recording_id)
+            compressed = self._local[recording_id]
+
+        return zlib.decompress(compressed).decode() if compressed is not None else None
+
+    async def set(self, recording_id: int, transcript_text: str):
+        compressed = zlib.compress(transcript_text.encode(), 6)
+
+        if self.redis is not None:
+            try:
+                await self.redis.set(self._key(recording_id), compressed, ex=self.ttl)
+            except redis.RedisError as e:
+                print(f"Transcript cache Redis write failed: {e}")
+            return
+
+        if recording_id in self._local:
+            self._local_bytes -= len(self._local.pop(recording_id))
+        self._local[recording_id] = compressed
+        self._local_bytes += len(compressed)
+        while self._local_bytes > self.max_local_bytes and len(self._local) > 1:
+            _, evicted = self._local.popitem(last=False)
+            self._local_bytes -= len(evicted)
+
+    async def get_transcript(self, fathom: Fathom, recording_id: int) -> str:
+        """
+        Read-through: the cached text, or download, format and cache it.
+        """
+        transcript_text = await self.get(recording_id)
+        if transcript_text is not None:
+            return transcript_text
+
+        transcript = await fathom.get_recording_transcript_async(recording_id=recording_id, destination_url="")
+        transcript_text = format_transcript(transcript)
+        await self.set(recording_id, transcript_text)
+        return transcript_text
+
+transcript_cache = TranscriptCache(async_redis_client, ttl=FATHOM_TRANSCRIPT_CACHE_TTL, max_local_bytes=FATHOM_TRANSCRIPT_CACHE_MAX_LOCAL_BYTES)
@@ -1,4 +1,9 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from src.core.database import create_supabase, create_supabase_http_client
+from src.core.cache import async_redis_client
+from src.candidates.services.ashby import ashby_service
+from src.services.candidate_lifecycle_service import lemlist_service
 from src.candidates.router import router as candidates_router
 from src.campaigns.router import router as campaigns_router
 from src.asbhy.router import router as ashby_router
@@ -6,7 +11,22 @@ from src.auth.router import router as auth_router
 from src.fathom.router import router as fathom_router
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pooled Supabase, Lemlist, Ashby and Redis clients live for the whole process and are closed on shutdown
+    async with create_supabase_http_client() as supabase_http_client:
+        app.state.supabase = await create_supabase(supabase_http_client)
+        await lemlist_service.open()
+        await ashby_service.open()
+        try:
+            yield
+        finally:
+            await lemlist_service.aclose()
+            await ashby_service.aclose()
+            if async_redis_client is not None:
+                await async_redis_client.aclose()
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(candidates_router)
 app.include_router(campaigns_router)
@@ -1,14 +1,31 @@
 from src.campaigns.services.lemlist_async import LemListService
 from src.core.database import AsyncClient
-from src.config import LEMLIST_API_KEY
+from src.config import (
+    LEMLIST_API_KEY,
+    LEMLIST_HTTP_MAX_CONNECTIONS,
+    LEMLIST_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    LEMLIST_HTTP_KEEPALIVE_EXPIRY,
+    LEMLIST_HTTP_TIMEOUT,
+    LEMLIST_HTTP2,
+)
+from src.candidates.repository import CandidateRepository, CandidateProjection
 
-lemlist_service = LemListService(LEMLIST_API_KEY)
+# Shared by the campaigns router
+lemlist_service = LemListService(
+    LEMLIST_API_KEY,
+    max_connections=LEMLIST_HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=LEMLIST_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=LEMLIST_HTTP_KEEPALIVE_EXPIRY,
+    timeout=LEMLIST_HTTP_TIMEOUT,
+    http2=LEMLIST_HTTP2,
+)
 
 class CandidateLifecycleService:
     def __init__(self, 
                  supabase_client: AsyncClient,
                  lemlist_service: LemListService = lemlist_service):
         self.supabase = supabase_client
+        self.candidates = CandidateRepository(supabase_client)
         self.lemlist = lemlist_service
 
     async def delete_candidate_safely(self, candidate_id: int):
@@ -17,9 +34,9 @@ class CandidateLifecycleService:
         if lemlist_campaign.data:
             await self.lemlist.pause_campaign(lemlist_campaign.data[0]['lemlist_campaign_id'])
 
-        user_id = await self.supabase.table("candidates").select("user_id").eq("id", int(candidate_id)).execute()
+        candidate = await self.candidates.get(candidate_id, CandidateProjection.STATUS)
         response = await self.supabase.table("candidates").delete().eq("id", int(candidate_id)).execute()
 
-        await self.supabase.auth.admin.delete_user(user_id.data[0]['user_id'])
+        await self.supabase.auth.admin.delete_user(candidate['user_id'])
 
         return True
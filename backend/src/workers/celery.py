@@ -1,4 +1,5 @@
 from celery import Celery
+from kombu import Queue
 import os
 
 celery_app = Celery(__name__)
@@ -6,4 +7,19 @@ celery_app.conf.broker_url = os.getenv('CELERY_BROKER_URL')
 celery_app.conf.result_backend = os.getenv('CELERY_RESULT_BACKEND')
 celery_app.conf.broker_connection_retry_on_startup = True
 
+# One queue per kind of work so slow LLM calls never hold up the cheap I/O stages; each queue
+# gets its own worker pool (concurrency and prefetch are set on the worker command line)
+celery_app.conf.task_queues = (
+    Queue("celery"),
+    Queue("llm"),
+    Queue("apollo"),
+    Queue("lemlist"),
+)
+celery_app.conf.task_routes = {
+    "src.candidates.tasks.process_candidate": {"queue": "llm"},
+    "src.candidates.tasks.find_companies_apollo": {"queue": "apollo"},
+    "src.candidates.tasks.find_decision_makers_apollo": {"queue": "apollo"},
+    "src.campaigns.tasks.*": {"queue": "lemlist"},
+}
+
 celery_app.autodiscover_tasks(packages=['src.candidates.tasks', 'src.campaigns.tasks'])
\ No newline at end of file
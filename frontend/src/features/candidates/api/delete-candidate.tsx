@@ -1,8 +1,10 @@
-import { useMutation, useQueryClient, type UseMutationOptions } from '@tanstack/react-query';
+import { useMutation, useQueryClient, type InfiniteData, type UseMutationOptions } from '@tanstack/react-query';
 
 import { api } from '@/lib/api-client';
 import type { Candidate } from '@/types/api';
 
+import type { CandidatesPage } from './get-candidates';
+
 export const deleteCandidate = (id: number): Promise<Candidate> => {
     return api.delete(`/candidates/${id}`);
 };
@@ -21,16 +23,20 @@ export const useDeleteCandidate = ({ mutationConfig }: UseDeleteCandidateOptions
             // Cancel any ongoing queries to prevent them from overriding our optimistic update
             await queryClient.cancelQueries({ queryKey: ['candidates'] });
 
-            // Snapshot the current candidates list
-            const previousCandidates = queryClient.getQueryData(['candidates']);
+            // Snapshot every cached candidates list (one infinite query per page size)
+            const previousCandidates = queryClient.getQueriesData<InfiniteData<CandidatesPage>>({ queryKey: ['candidates'] });
+
+            // Optimistically remove the candidate from each loaded page
+            queryClient.setQueriesData<InfiniteData<CandidatesPage>>({ queryKey: ['candidates'] }, (old) => {
+                // ['candidates', id] detail queries share the prefix but are not paged
+                if (!old?.pages) return old;
 
-            // Optimistically remove the candidate from the list
-            queryClient.setQueryData(['candidates'], (old: any) => {
-                if (!old?.data) return old;
-                
                 return {
                     ...old,
-                    data: old.data.filter((candidate: Candidate) => candidate.id !== candidateId)
+                    pages: old.pages.map((page) => ({
+                        ...page,
+                        data: page.data.filter((candidate) => candidate.id !== candidateId),
+                    })),
                 };
             });
 
@@ -40,9 +46,9 @@ export const useDeleteCandidate = ({ mutationConfig }: UseDeleteCandidateOptions
         // If mutation fails, rollback the optimistic update
         onError: (error, candidateId, context) => {
             // Restore the previous state
-            if (context?.previousCandidates) {
-                queryClient.setQueryData(['candidates'], context.previousCandidates);
-            }
+            context?.previousCandidates.forEach(([queryKey, previousData]) => {
+                queryClient.setQueryData(queryKey, previousData);
+            });
             
             // Call the original onError if provided
             mutationConfig?.onError?.(error, candidateId, context);
@@ -1,43 +1,51 @@
-import { queryOptions, useQuery } from '@tanstack/react-query';
+import { infiniteQueryOptions, useInfiniteQuery } from '@tanstack/react-query';
 import type { QueryConfig } from '@/lib/react-query';
 
 import { api } from '@/lib/api-client';
 import type { Candidate } from '@/types/api';
 
-export const getCandidates = (
-  page = 1,
-): Promise<{
+export type CandidatesPage = {
   data: Candidate[];
-}> => {
+  next_cursor: string | null;
+  count: number | null;
+};
+
+export const getCandidates = ({
+  cursor,
+  limit,
+}: { cursor?: string | null; limit?: number } = {}): Promise<CandidatesPage> => {
   return api.get(`/candidates`, {
     params: {
-      page,
+      cursor: cursor ?? undefined,
+      limit,
     },
   });
 };
 
 export const getCandidatesQueryOptions = ({
-  page,
-}: { page?: number } = {}) => {
-  return queryOptions({
-    queryKey: page ? ['candidates', { page }] : ['candidates'],
-    queryFn: () => getCandidates(page),
+  limit,
+}: { limit?: number } = {}) => {
+  return infiniteQueryOptions({
+    queryKey: limit ? ['candidates', { limit }] : ['candidates'],
+    queryFn: ({ pageParam }) => getCandidates({ cursor: pageParam, limit }),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
   });
 };
 
 type UseCandidatesOptions = {
-  page?: number;
+  limit?: number;
   queryConfig?: QueryConfig<typeof getCandidatesQueryOptions>;
 };
 
 export const useCandidates = ({
   queryConfig,
-  page,
+  limit,
 }: UseCandidatesOptions) => {
   const options = {
-    ...getCandidatesQueryOptions({ page }),
+    ...getCandidatesQueryOptions({ limit }),
     ...queryConfig,
   };
   
-  return useQuery(options);
+  return useInfiniteQuery(options);
 };
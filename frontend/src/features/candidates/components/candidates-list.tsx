@@ -95,7 +95,7 @@ const tableConfig: TableConfig<Candidate> = {
 const CandidatesList = () => {
   const navigate = useNavigate();
   const candidatesQuery = useCandidates({
-    page: 1, // Default to first page for now
+    limit: 50,
     queryConfig: {
       refetchInterval: 5 * 1000, // 10 seconds
     },
@@ -109,7 +109,7 @@ const CandidatesList = () => {
     );
   }
 
-  const candidates = candidatesQuery.data?.data || [];
+  const candidates = candidatesQuery.data?.pages.flatMap((page) => page.data) || [];
 
   if (!candidates) return null;
 
@@ -135,6 +135,18 @@ const CandidatesList = () => {
         config={tableConfig}
         onAction={handleAction}
       />
+      {candidatesQuery.hasNextPage && (
+        <div className="flex justify-center mt-4">
+          <Button
+            onClick={() => candidatesQuery.fetchNextPage()}
+            disabled={candidatesQuery.isFetchingNextPage}
+            variant="outline"
+            size="sm"
+          >
+            {candidatesQuery.isFetchingNextPage ? "Loading..." : "Load more"}
+          </Button>
+        </div>
+      )}
     </div>
   );
 };
@@ -1,6 +1,7 @@
 import { PDFIcon } from "@/components/ui/icons";
 import type { Candidate } from "@/types/api";
 import { downloadBlindedResume } from "../utils/pdf";
+import { getCandidate } from "../api/get-candidate";
 import { getActionTooltip, isResumeReady } from "../utils/processing-status";
 import { Tooltip } from "@/components/ui/tooltip/Tooltip";
 
@@ -20,17 +21,19 @@ export const DownloadResume = ({ candidate, onDownload }: DownloadResumeProps) =
     }
 
     try {
-      const candidateName = `${candidate.extracted_data?.candidate_first_name}`;
+      // The candidates list only carries summary columns, so load extracted_data on demand
+      const extractedData = candidate.extracted_data ?? (await getCandidate({ candidateId: candidate.id })).data.extracted_data;
+      const candidateName = `${extractedData?.candidate_first_name}`;
       
       // Check if extracted_data exists
-      if (!candidate.extracted_data) {
+      if (!extractedData) {
         console.warn("No extracted data available for this candidate");
         // You might want to show a toast notification here
         return;
       }
       
       await downloadBlindedResume({ 
-        data: candidate.extracted_data, 
+        data: extractedData, 
         role: candidate.role,
         name: candidateName 
       });